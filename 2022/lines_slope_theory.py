@@ -1,4 +1,4 @@
-from manimlib import *
+from manim_imports_ext import *
 
 # Note:
 
@@ -11,7 +11,7 @@ axis_config = {
 phi = (math.sqrt(5) - 1) / 2
 
 # Create a 5x5 (1 unit length) coordinate
-axes_large = Axes(
+axes_large = AxesX(
     x_range=(-5, 5),
     y_range=(-5, 5),
     width=8,
@@ -30,7 +30,7 @@ axes_large.add_coordinate_labels(
 
 # Create a 4x4 (1 unit length) coordinate
 # This coordinate is for starting() and proving()
-axes = Axes(
+axes = AxesX(
     x_range=(-4, 4),
     y_range=(-4, 4),
     width=6,
@@ -62,7 +62,7 @@ def align_tex_group_to_left(tex_group):
             item.align_to(tex_group[i - 1], LEFT)
 
 
-class Main(Scene):
+class Main(SceneX):
     # Create a method to move mobjects (graph, label, elbow)
     # This is for proving_by_algebra()
     def move_mobjects(self, graph, exp, color, label, exp_tex, elbow, pos):
@@ -75,7 +75,7 @@ class Main(Scene):
         if label == exp_tex:
             label_animate = ReplacementTransform(label, label_conv)
         else:
-            label_animate = TransformMatchingTex(label, label_conv)
+            label_animate = TransformMatchingTexX(label, label_conv)
 
         self.play(
             ReplacementTransform(graph, graph_conv),
@@ -112,10 +112,12 @@ class Main(Scene):
     # The entry of animation
     def construct(self):
         self.wait(1)
-        self.start()
-        self.prove_by_algebra()
-        self.prove_by_geometry()
-        self.end()
+        self.run_sections(
+            self.start,
+            self.prove_by_algebra,
+            self.prove_by_geometry,
+            self.end,
+        )
 
     # Starting
     def start(self):
@@ -491,8 +493,8 @@ class Main(Scene):
         self.wait(2)
 
         # Create lines and points (H, I)
-        v_line_p = always_redraw(lambda: axes.get_v_line(p.get_bottom()))
-        v_line_q = always_redraw(lambda: axes.get_v_line(q.get_bottom()))
+        v_line_p = axes.get_v_line_to(p.get_bottom)
+        v_line_q = axes.get_v_line_to(q.get_bottom)
         h = Dot(color=RED)
         h.move_to(axes.c2p(1, 0))
         h_label = Tex("H")
@@ -1028,8 +1030,8 @@ class Main(Scene):
         self.wait(2)
 
         # Create lines and points (H, I)
-        v_line_p = always_redraw(lambda: axes.get_v_line(p.get_bottom()))
-        v_line_q = always_redraw(lambda: axes.get_v_line(q.get_bottom()))
+        v_line_p = axes.get_v_line_to(p.get_bottom)
+        v_line_q = axes.get_v_line_to(q.get_bottom)
         h = Dot(color=RED)
         h.move_to(axes.c2p(1, 0))
         h_label = Tex("H")
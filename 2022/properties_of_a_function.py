@@ -1,9 +1,9 @@
-from manimlib import *
+from manim_imports_ext import *
 from os import system
 
 to_isolate = ["y", "ax", "b", r"\frac cx"]
 
-t2c_map_tex = {
+t2c_map_tex = ColorMap({
     "+": WHITE,
     "=": WHITE,
     "y": BLUE_B,
@@ -12,9 +12,9 @@ t2c_map_tex = {
     r"\frac 1x": TEAL,
     "b": GREEN_B,
     r"\frac 32": GREEN_B,
-}
+})
 
-t2c_map_tex_multi_y = {
+t2c_map_tex_multi_y = ColorMap({
     "+": WHITE,
     "=": WHITE,
     "ax": YELLOW_B,
@@ -25,9 +25,9 @@ t2c_map_tex_multi_y = {
     "y_1": YELLOW_B,
     "y_2": GREEN_B,
     "y_3": TEAL
-}
+})
 
-t2c_map = {
+t2c_map = ColorMap({
     "$a$": YELLOW_B,
     "$b$": GREEN_B,
     "$c$": TEAL,
@@ -45,7 +45,7 @@ t2c_map = {
     "$b = 0$": GREEN_B,
     "$x_1$": YELLOW_B,
     "$x_2$": YELLOW_B
-}
+})
 
 func = Tex(
     r"y = ax + b + \frac cx",
@@ -54,11 +54,12 @@ func = Tex(
 ).to_corner(UL)
 
 # Create a 4x4 (1 unit length) coordinate
-axes = Axes(
+axes = AxesX(
     x_range=(-4, 4),
     y_range=(-4, 4),
     width=6,
     height=6,
+    detect_graph_discontinuities=True,
 
     axis_config={
         "stroke_color": WHITE,
@@ -75,8 +76,7 @@ axes.add_coordinate_labels(font_size=20)
 function_graph = axes.get_graph(
     # y = x - 0.25 + \frac 1x
     lambda x: x - 0.25 + 1 / x,
-    color=BLUE_B,
-    discontinuities=[0]
+    color=BLUE_B
 )
 
 function_label = axes.get_graph_label(
@@ -93,7 +93,7 @@ def align_group(text_group):
             item.next_to(text_group[i - 1], DOWN, aligned_edge=LEFT)
 
 
-class Main(Scene):
+class Main(SceneX):
     # For change_tex()
     current_tex = None
 
@@ -121,11 +121,13 @@ class Main(Scene):
     # The entry of animation
     def construct(self):
         self.wait()
-        self.start()
-        self.observe()
-        self.solve_for_min_or_max_value()
-        self.show_formula()
-        self.end()
+        self.run_sections(
+            self.start,
+            self.observe,
+            self.solve_for_min_or_max_value,
+            self.show_formula,
+            self.end,
+        )
 
     def start(self):
         explore = TexText("探究一类函数的性质", color=BLUE_B, font_size=65)
@@ -244,27 +246,16 @@ class Main(Scene):
         self.current_tex = change_value
         self.change_tex(r"改变 $a$", 1, 2)
 
-        # Change "a" from 1 to 2
-        function_graph_previous = function_graph
-
-        # Replace previous graph with updated graph every loop
-        for i in range(1, 101):
-            a = 1 + i / 100
-
-            # Update the DecimalNumber
-            num_a.set_value(a)
-
-            # Create updated graph
-            function_graph_temp = axes.get_graph(
-                lambda x: a * x - 0.25 + 1 / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            # Animate
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        # Change "a" from 1 to 2, one frame (at 60 fps) per step of 0.01
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, a: a * x - 0.25 + 1 / x,
+                {"a": (1, 2)}
+            ),
+            ChangeDecimalToValue(num_a, 2, rate_func=linear),
+            run_time=100 / 60
+        )
 
         self.wait(3)
 
@@ -278,20 +269,15 @@ class Main(Scene):
         self.change_tex(r"改变 $a$", 1, 2)
 
         # Change "a" from 2 to -1
-        # Duplicated code, it's inefficient and complicated to package into a function :(
-        for i in range(1, 301):
-            a = 2 - i / 100
-            num_a.set_value(a)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: a * x - 0.25 + 1 / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, a: a * x - 0.25 + 1 / x,
+                {"a": (2, -1)}
+            ),
+            ChangeDecimalToValue(num_a, -1, rate_func=linear),
+            run_time=300 / 60
+        )
 
         self.wait(3)
 
@@ -305,36 +291,28 @@ class Main(Scene):
         self.change_tex(r"改变 $c$", 1, 2)
 
         # Change "c" from 1 to 2
-        for i in range(1, 101):
-            c = 1 + i / 100
-            num_c.set_value(c)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: -x - 0.25 + c / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, c: -x - 0.25 + c / x,
+                {"c": (1, 2)}
+            ),
+            ChangeDecimalToValue(num_c, 2, rate_func=linear),
+            run_time=100 / 60
+        )
 
         self.wait(2)
 
         # Change "c" from 2 to -1
-        for i in range(1, 301):
-            c = 2 - i / 100
-            num_c.set_value(c)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: -x - 0.25 + c / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, c: -x - 0.25 + c / x,
+                {"c": (2, -1)}
+            ),
+            ChangeDecimalToValue(num_c, -1, rate_func=linear),
+            run_time=300 / 60
+        )
 
         self.wait(3)
 
@@ -348,53 +326,41 @@ class Main(Scene):
         self.change_tex(r"改变 $b$", 1, 2)
 
         # Change "b" from -0.25 to -1.25
-        for i in range(1, 101):
-            b = -0.25 - i / 100
-            num_b.set_value(b)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: -x + b - 1 / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, b: -x + b - 1 / x,
+                {"b": (-0.25, -1.25)}
+            ),
+            ChangeDecimalToValue(num_b, -1.25, rate_func=linear),
+            run_time=100 / 60
+        )
 
         self.wait()
 
         # Change "b" from -1.25 to 0.75
-        for i in range(1, 201):
-            b = -1.25 + i / 100
-            num_b.set_value(b)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: -x + b - 1 / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, b: -x + b - 1 / x,
+                {"b": (-1.25, 0.75)}
+            ),
+            ChangeDecimalToValue(num_b, 0.75, rate_func=linear),
+            run_time=200 / 60
+        )
 
         self.wait()
 
         # Change "b" from 0.75 to -0.25
-        for i in range(1, 101):
-            b = 0.75 - i / 100
-            num_b.set_value(b)
-
-            function_graph_temp = axes.get_graph(
-                lambda x: -x + b - 1 / x, color=BLUE_B, discontinuities=[0]
-            )
-
-            self.play(
-                ReplacementTransform(function_graph_previous, function_graph_temp),
-                run_time=0.001
-            )
-            function_graph_previous = function_graph_temp
+        self.play(
+            ParameterSweep(
+                function_graph, axes,
+                lambda x, b: -x + b - 1 / x,
+                {"b": (0.75, -0.25)}
+            ),
+            ChangeDecimalToValue(num_b, -0.25, rate_func=linear),
+            run_time=100 / 60
+        )
 
         # Show some text
         self.change_tex(
@@ -479,11 +445,12 @@ class Main(Scene):
         self.play(Write(func_specific))
 
         # Base
-        axes_base = Axes(
+        axes_base = AxesX(
             x_range=(-4, 4),
             y_range=(-4, 4),
             width=6,
             height=6,
+            detect_graph_discontinuities=True,
 
             axis_config={
                 "stroke_color": WHITE,
@@ -499,8 +466,7 @@ class Main(Scene):
 
         func_graph_specific = axes_base.get_graph(
             lambda x: x + 1.5 + 1 / x,
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
 
         self.play(
@@ -562,7 +528,7 @@ class Main(Scene):
         prop_func_graph = axes_base.get_graph(lambda x: x, color=YELLOW_B)
         const_func_graph = axes_base.get_graph(lambda x: 1.5, color=GREEN_B)
         inv_prop_func_graph = axes_base.get_graph(
-            lambda x: 1 / x if not x == 0 else 10, color=TEAL, discontinuities=[0])
+            lambda x: 1 / x if not x == 0 else 10, color=TEAL)
         # Prevent runtime error (Divide by 0)
 
         self.play(ShowCreationThenDestructionAround(prop_func))
@@ -594,8 +560,7 @@ class Main(Scene):
         ).to_corner(UL)
         func_graph_specific_zeroed = axes_base.get_graph(
             lambda x: x + 1 / x if not x == 0 else 10,  # Prevent runtime error (Divide by 0)
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
 
         self.play(
@@ -699,10 +664,8 @@ class Main(Scene):
 
         self.play(Write(results[1]))
 
-        h_line_from_prop_func = always_redraw(
-            lambda: axes_base.get_h_line(dot_from_prop_func.get_center(), color=RED))
-        h_line_from_func = always_redraw(
-            lambda: axes_base.get_h_line(dot_from_func.get_center(), color=RED))
+        h_line_from_prop_func = axes_base.get_h_line_to(dot_from_prop_func, color=RED)
+        h_line_from_func = axes_base.get_h_line_to(dot_from_func, color=RED)
         self.play(
             ShowCreation(h_line_from_prop_func),
             ShowCreation(h_line_from_func),
@@ -774,8 +737,7 @@ class Main(Scene):
         func_graph_specific = axes_base.get_graph(
             # Prevent runtime error (Divide by 0)
             lambda x: x + 1.5 + 1 / x if not x == 0 else 10,
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
 
         # Transform back
@@ -966,11 +928,12 @@ class Main(Scene):
         self.play(Write(text_group_right[1][1]))
 
         # Show the coordinate temporarily
-        axes_temp = Axes(
+        axes_temp = AxesX(
             x_range=(-4, 4),
             y_range=(-4, 4),
             width=6,
             height=6,
+            detect_graph_discontinuities=True,
 
             axis_config={
                 "stroke_color": WHITE,
@@ -987,18 +950,16 @@ class Main(Scene):
         func_graph = axes_temp.get_graph(
             # Prevent runtime error (Divide by 0)
             lambda x: x + 1.5 + 1 / x if not x == 0 else 10,
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
         func_graph_zeroed = axes_temp.get_graph(
             # Prevent runtime error (Divide by 0)
             lambda x: x + 1 / x if not x == 0 else 10,
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
         prop_func_graph = axes_temp.get_graph(lambda x: x, color=YELLOW_B)
         inv_prop_func_graph = axes_temp.get_graph(
-            lambda x: 1 / x if not x == 0 else 10, color=TEAL, discontinuities=[0])
+            lambda x: 1 / x if not x == 0 else 10, color=TEAL)
         self.play(
             ShowCreation(func_graph),
             ShowCreation(prop_func_graph),
@@ -1026,8 +987,7 @@ class Main(Scene):
         func_graph = axes_temp.get_graph(
             # Prevent runtime error (Divide by 0)
             lambda x: x + 1.5 + 1 / x if not x == 0 else 10,
-            color=BLUE_B,
-            discontinuities=[0]
+            color=BLUE_B
         )
         self.play(
             ReplacementTransform(func_graph_zeroed, func_graph),
@@ -1125,7 +1085,7 @@ class Main(Scene):
         self.wait(2)
 
 
-class Cover(Scene):
+class Cover(SceneX):
     def construct(self):
         self.play(Write(
             Tex(
@@ -1,7 +1,7 @@
 from manim_imports_ext import *
 
 
-t2c_map = {
+t2c_map = ColorMap({
     "AB": BLUE_B,
     "BC": BLUE_B,
     "BH": BLUE_B,
@@ -27,9 +27,9 @@ t2c_map = {
     r"\mathrm{Rt}\triangle EID": YELLOW_B,
     r"\triangle DEF": YELLOW_B,
     "=": WHITE
-}
+})
 
-t2c_map_for_tex_text = {
+t2c_map_for_tex_text = ColorMap({
     "$B$": BLUE_B,
     r"$BH \bot AC$": BLUE_B,
     "$AC$": BLUE_B,
@@ -38,10 +38,10 @@ t2c_map_for_tex_text = {
     r"$EI \bot DF$": YELLOW_B,
     "$DF$": YELLOW_B,
     "$I$": YELLOW_B
-}
+})
 
 
-class ShowQuestionScene(Scene):
+class ShowQuestionScene(SceneX):
     current_subtitle = None
 
     def change_subtitle(self, new_subtitle, run_time=0.5, waiting_time=1.0):
@@ -171,14 +171,17 @@ class ShowQuestionScene(Scene):
         self.play(ReplacementTransform(angle_f.copy(), conditions[10]), run_time=0.5)
         self.wait()
 
-        self.change_subtitle(Subtitle("众所周知，"), waiting_time=0.5)
-        self.change_subtitle(
-            Subtitle("三角形两边及一个邻角分别相等不能判定两个三角形全等"),
-            run_time=0.3,
-            waiting_time=2
-        )
-        self.change_subtitle(Subtitle("即 SSA 不能判定两个三角形全等"), run_time=0.3)
-        self.change_subtitle(Subtitle("下面给出一个 SSA 的伪证"), waiting_time=4)
+        # Later subtitles compile while the earlier ones play
+        subtitles = [
+            Subtitle("众所周知，", lazy=True),
+            Subtitle("三角形两边及一个邻角分别相等不能判定两个三角形全等", lazy=True),
+            Subtitle("即 SSA 不能判定两个三角形全等", lazy=True),
+            Subtitle("下面给出一个 SSA 的伪证", lazy=True),
+        ]
+        self.change_subtitle(subtitles[0], waiting_time=0.5)
+        self.change_subtitle(subtitles[1], run_time=0.3, waiting_time=2)
+        self.change_subtitle(subtitles[2], run_time=0.3)
+        self.change_subtitle(subtitles[3], waiting_time=4)
 
         self.play(self.current_subtitle.animate.shift(0.5 * UP), run_time=0.5, rate_func=smooth)
         self.play(self.current_subtitle.animate.shift(3 * DOWN), run_time=0.5, rate_func=rush_into)
@@ -368,10 +371,14 @@ class ShowQuestionScene(Scene):
                 )
 
         self.current_subtitle = Subtitle("通过证明两个小三角形全等，我们似乎证明了 SSA")
+        subtitles = [
+            Subtitle("这样的结论明显是错的", lazy=True),
+            Subtitle("那么错在哪呢？", lazy=True),
+        ]
         self.play(Write(self.current_subtitle))
         self.wait()
-        self.change_subtitle(Subtitle("这样的结论明显是错的"))
-        self.change_subtitle(Subtitle("那么错在哪呢？"))
+        self.change_subtitle(subtitles[0])
+        self.change_subtitle(subtitles[1])
         self.wait()
 
         count = 5
@@ -572,12 +579,12 @@ class ShowQuestionScene(Scene):
                 self.play(Write(tex_text))
                 self.wait(2)
             elif i <= 7:
-                self.play(TransformMatchingTex(proof_for_acute_triangles[i - 1].copy(), tex_text))
+                self.play(TransformMatchingTexX(proof_for_acute_triangles[i - 1].copy(), tex_text))
                 self.wait(2)
             elif i > 7:
                 tex_text.next_to(proof_for_acute_triangles[i - 1], 1.5 * DOWN)
                 tex_text.align_to(proof_for_acute_triangles[i - 1], LEFT)
-                self.play(TransformMatchingTex(proof_for_acute_triangles[i - 1].copy(), tex_text))
+                self.play(TransformMatchingTexX(proof_for_acute_triangles[i - 1].copy(), tex_text))
                 self.wait(2)
 
             if i == 0:
@@ -0,0 +1,274 @@
+import glob
+import hashlib
+import importlib
+import importlib.metadata
+import inspect
+import io
+import marshal
+import os
+import pickle
+import sys
+import types
+
+from manimlib import *
+from manimlib.config import get_custom_config
+from manimlib.logger import log
+from manimlib.utils.directories import get_temp_dir
+
+
+# Scene state at the start of each section of SceneX.run_sections, pickled
+# under temp/checkpoints/<Scene>/. A checkpoint holds the scene's mobjects
+# (trackers and the camera frame included), the attributes construct has
+# set on the scene, the module level mobjects of the scene's file, and the
+# elapsed time and number of plays, all in one pickle so shared mobjects
+# stay shared.
+#
+# It is named after a hash of the scene file with the sources of that
+# section and the ones after it left out, so it stays valid while only
+# those are edited. The hash also covers the sources of custom/,
+# custom_config.yml, the manimgl and Python versions and the resolution
+# (graphs are sampled for it), which the state was built with.
+#
+# Functions pickle doesn't find by name (lambdas, closures such as
+# updaters and graph functions, anything defined in the scene file) are
+# pickled by value: bytecode, defaults, closure and attributes, with their
+# module globals looked up again on load. The scene, its camera and
+# classes of the scene file are stored as references to those of the
+# loading process. State which still can't be pickled means no checkpoint
+# for that section, which is logged as an error.
+def get_checkpoint_config() -> dict:
+    return {
+        "enabled": True,
+        **(get_custom_config().get("checkpoints") or {}),
+    }
+
+
+def get_checkpoint_dir(scene: Scene) -> str:
+    return os.path.join(get_temp_dir(), "checkpoints", type(scene).__name__)
+
+
+CUSTOM_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENVIRONMENT_HASH = None
+
+
+def get_environment_hash() -> str:
+    global ENVIRONMENT_HASH
+    if ENVIRONMENT_HASH is None:
+        digest = hashlib.sha256()
+        # Bytecode of pickled functions is only valid for one version
+        digest.update(sys.version.encode())
+        try:
+            digest.update(importlib.metadata.version("manimgl").encode())
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        paths = sorted(glob.glob(os.path.join(CUSTOM_DIR, "*.py")))
+        # manimgl reads custom_config.yml from the working directory
+        paths.append("custom_config.yml")
+        for path in paths:
+            digest.update(os.path.basename(path).encode())
+            try:
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+            except OSError:
+                pass
+        ENVIRONMENT_HASH = digest.hexdigest()
+    return ENVIRONMENT_HASH
+
+
+def get_upstream_hash(scene: Scene, sections: list, index: int) -> str:
+    with open(inspect.getsourcefile(type(scene)), "r", encoding="utf-8") as file:
+        source = file.read()
+    for section in sections[index:]:
+        source = source.replace(inspect.getsource(section), f"<section {section.__name__}>")
+    resolution = f"{scene.camera.pixel_width}x{scene.camera.pixel_height}"
+    key = f"{type(scene).__name__}\n{index}\n{resolution}\n{get_environment_hash()}\n{source}"
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def get_checkpoint_path(scene: Scene, sections: list, index: int) -> str:
+    name = f"{index}_{sections[index].__name__}_{get_upstream_hash(scene, sections, index)}.pkl"
+    return os.path.join(get_checkpoint_dir(scene), name)
+
+
+# manimgl loads the scene file without adding it to sys.modules
+def get_scene_module_vars(scene: Scene) -> dict:
+    return type(scene).construct.__globals__
+
+
+def is_found_by_name(function: types.FunctionType) -> bool:
+    target = sys.modules.get(function.__module__)
+    for name in function.__qualname__.split("."):
+        target = getattr(target, name, None)
+    return target is function
+
+
+# FunctionType and CellType can't be pickled by name themselves
+def make_function(code, globals, name, defaults, closure) -> types.FunctionType:
+    return types.FunctionType(code, globals, name, defaults, closure)
+
+
+def make_cell() -> types.CellType:
+    return types.CellType()
+
+
+def set_function_state(function: types.FunctionType, state: tuple) -> None:
+    function.__qualname__, function.__kwdefaults__, function.__module__, attrs = state
+    function.__dict__.update(attrs)
+
+
+def set_cell_contents(cell: types.CellType, contents) -> None:
+    cell.cell_contents = contents
+
+
+class CheckpointPickler(pickle.Pickler):
+    def __init__(self, file, scene: Scene):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.scene = scene
+        self.scene_globals = get_scene_module_vars(scene)
+
+    def persistent_id(self, obj):
+        if obj is self.scene:
+            return ("scene",)
+        if obj is self.scene.camera:
+            return ("camera",)
+        if obj is self.scene_globals:
+            return ("scene_globals",)
+        if isinstance(obj, dict) and isinstance(obj.get("__name__"), str):
+            module = sys.modules.get(obj["__name__"])
+            if module is not None and module.__dict__ is obj:
+                return ("module_globals", obj["__name__"])
+        if isinstance(obj, type) and obj.__module__ == self.scene_globals["__name__"]:
+            return ("scene_class", obj.__qualname__)
+        return None
+
+    def reducer_override(self, obj):
+        if isinstance(obj, types.FunctionType) and not is_found_by_name(obj):
+            # The cells are created before their contents are pickled, so
+            # a closure may refer back to its function
+            closure = obj.__closure__
+            args = (obj.__code__, obj.__globals__, obj.__name__, obj.__defaults__, closure)
+            state = (obj.__qualname__, obj.__kwdefaults__, obj.__module__, obj.__dict__)
+            return (make_function, args, state, None, None, set_function_state)
+        if isinstance(obj, types.CellType):
+            try:
+                contents = obj.cell_contents
+            except ValueError:
+                return (make_cell, ())
+            return (make_cell, (), contents, None, None, set_cell_contents)
+        if isinstance(obj, types.CodeType):
+            return (marshal.loads, (marshal.dumps(obj),))
+        return NotImplemented
+
+
+class CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file, scene: Scene):
+        super().__init__(file)
+        self.scene = scene
+
+    def persistent_load(self, pid):
+        kind, *args = pid
+        if kind == "scene":
+            return self.scene
+        if kind == "camera":
+            return self.scene.camera
+        if kind == "scene_globals":
+            return get_scene_module_vars(self.scene)
+        if kind == "module_globals":
+            return importlib.import_module(args[0]).__dict__
+        if kind == "scene_class":
+            target = get_scene_module_vars(self.scene)[args[0].split(".")[0]]
+            for name in args[0].split(".")[1:]:
+                target = getattr(target, name)
+            return target
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+
+def dump_scene_state(scene: Scene, state: dict) -> bytes:
+    file = io.BytesIO()
+    CheckpointPickler(file, scene).dump(state)
+    return file.getvalue()
+
+
+def load_scene_state(scene: Scene, data: bytes) -> dict:
+    return CheckpointUnpickler(io.BytesIO(data), scene).load()
+
+
+def get_scene_state(scene: Scene, base_attrs: set[str]) -> dict:
+    return {
+        "mobjects": scene.mobjects,
+        "frame": scene.camera.frame,
+        "attrs": {
+            key: value
+            for key, value in scene.__dict__.items()
+            if key not in base_attrs
+        },
+        "globals": {
+            name: value
+            for name, value in get_scene_module_vars(scene).items()
+            if isinstance(value, Mobject)
+        },
+        "time": scene.time,
+        "num_plays": scene.num_plays,
+    }
+
+
+def set_scene_state(scene: Scene, state: dict) -> None:
+    get_scene_module_vars(scene).update(state["globals"])
+    scene.__dict__.update(state["attrs"])
+    scene.mobjects = state["mobjects"]
+    scene.camera.frame = state["frame"]
+    if hasattr(scene, "frame"):
+        scene.frame = state["frame"]
+    scene.time = state["time"]
+    scene.num_plays = state["num_plays"]
+
+
+def write_checkpoint(scene: Scene, base_attrs: set[str], sections: list, index: int) -> bool:
+    path = get_checkpoint_path(scene, sections, index)
+    if os.path.exists(path):
+        return True
+    try:
+        data = dump_scene_state(scene, get_scene_state(scene, base_attrs))
+    except (pickle.PicklingError, TypeError, AttributeError, ValueError, RecursionError) as error:
+        log.error(
+            "No checkpoint for section %s, the state can't be pickled: %s. "
+            "Renders of it will replay the sections before it.",
+            sections[index].__name__, error
+        )
+        return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Checkpoints of this section for older sources
+    prefix = f"{index}_{sections[index].__name__}_"
+    for file in os.listdir(os.path.dirname(path)):
+        if file.startswith(prefix) and file.endswith(".pkl") and file != os.path.basename(path):
+            try:
+                os.remove(os.path.join(os.path.dirname(path), file))
+            except FileNotFoundError:
+                pass
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+    return True
+
+
+def read_checkpoint(scene: Scene, sections: list, index: int) -> dict | None:
+    path = get_checkpoint_path(scene, sections, index)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as file:
+            return load_scene_state(scene, file.read())
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError, ValueError) as error:
+        log.error("Could not read checkpoint %s, replaying the sections before it: %s", path, error)
+        return None
+
+
+# Index of the last section with a valid checkpoint, or None
+def find_latest_checkpoint(scene: Scene, sections: list) -> int | None:
+    for index in reversed(range(len(sections))):
+        if os.path.exists(get_checkpoint_path(scene, sections, index)):
+            return index
+    return None
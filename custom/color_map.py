@@ -0,0 +1,100 @@
+import re
+from collections.abc import Mapping
+
+from manimlib import *
+
+
+# A tex_to_color_map compiled once and reused by every Tex built with it.
+#
+#     t2c_map = ColorMap({"AB": BLUE_B, "DE": YELLOW_B, ...})
+#     Tex(r"AB = DE", tex_to_color_map=t2c_map)
+#
+# Splitting the tex strings into parts uses one precompiled pattern, with
+# the same alternation order as Tex.break_up_tex_strings(), and the split
+# of each (strings, isolate) and the color of each part are cached, so
+# hundreds of lines sharing a map only pay for each string once.
+#
+# It is a Mapping and not a dict, so digest_config() passes it through
+# as it is instead of merging it into a new dict.
+class ColorMap(Mapping):
+    def __init__(self, tex_to_color_map: dict):
+        self.tex_to_color_map = dict(tex_to_color_map)
+        self.patterns = {}
+        self.splits = {}
+        self.colors = {}
+
+    def __getitem__(self, key):
+        return self.tex_to_color_map[key]
+
+    def __iter__(self):
+        return iter(self.tex_to_color_map)
+
+    def __len__(self) -> int:
+        return len(self.tex_to_color_map)
+
+    def __repr__(self) -> str:
+        return f"ColorMap({self.tex_to_color_map!r})"
+
+    # Shared between copies of the mobjects using it
+    def __deepcopy__(self, memo):
+        return self
+
+    def get_pattern(self, isolate: tuple[str, ...]) -> re.Pattern | None:
+        if isolate not in self.patterns:
+            substrings_to_isolate = [*isolate, *self.tex_to_color_map.keys()]
+            self.patterns[isolate] = re.compile("|".join(
+                "({})".format(re.escape(ss))
+                for ss in substrings_to_isolate
+            )) if substrings_to_isolate else None
+        return self.patterns[isolate]
+
+    def split(self, tex_strings: tuple[str, ...], isolate: tuple[str, ...] = ()) -> list[str]:
+        key = (tex_strings, isolate)
+        if key not in self.splits:
+            pattern = self.get_pattern(isolate)
+            if pattern is None:
+                pieces = list(tex_strings)
+            else:
+                pieces = []
+                for s in tex_strings:
+                    pieces.extend(pattern.split(s))
+            self.splits[key] = [p for p in pieces if p]
+        return list(self.splits[key])
+
+    # Color of a part, as set_color_by_tex_to_color_map() leaves it: every
+    # key contained in the part colors it, so the last one wins
+    def get_color(self, part_tex: str):
+        if part_tex not in self.colors:
+            color = None
+            for texs, value in self.tex_to_color_map.items():
+                if isinstance(texs, str):
+                    texs = (texs,)
+                if any(tex in part_tex for tex in texs):
+                    color = value
+            self.colors[part_tex] = color
+        return self.colors[part_tex]
+
+
+_break_up_tex_strings = Tex.break_up_tex_strings
+_set_color_by_tex_to_color_map = Tex.set_color_by_tex_to_color_map
+
+
+def break_up_tex_strings(self, tex_strings):
+    if not isinstance(self.tex_to_color_map, ColorMap):
+        return _break_up_tex_strings(self, tex_strings)
+    return self.tex_to_color_map.split(tuple(tex_strings), tuple(self.isolate))
+
+
+def set_color_by_tex_to_color_map(self, texs_to_color_map, **kwargs):
+    if not isinstance(texs_to_color_map, ColorMap) or kwargs:
+        return _set_color_by_tex_to_color_map(self, texs_to_color_map, **kwargs)
+    for submob in self.submobjects:
+        if isinstance(submob, SingleStringTex):
+            color = texs_to_color_map.get_color(submob.get_tex())
+            if color is not None:
+                submob.set_color(color)
+    return self
+
+
+Tex.break_up_tex_strings = break_up_tex_strings
+Tex.set_color_by_tex_to_color_map = set_color_by_tex_to_color_map
@@ -0,0 +1,83 @@
+import os
+import shutil
+import threading
+
+
+# Directory of cache entries (files or directories) kept under max_size
+# bytes. Once it grows past that, entries are evicted least recently used
+# first, by modification time: reading an entry touches it. Names ending
+# in .tmp are entries still being written, and are left alone.
+#
+# The size is counted once per process and then kept up to date with
+# what this process writes; eviction counts it again, so entries written
+# by renders running in parallel are accounted for there.
+class DiskCache:
+    def __init__(self, directory: str, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.size = None
+        self.evictions = 0
+        # Size accounting may be shared between threads
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get_entries(self) -> list[os.DirEntry]:
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if not entry.name.endswith(".tmp")]
+
+    def get_entry_size(self, path: str) -> int:
+        try:
+            if not os.path.isdir(path):
+                return os.path.getsize(path)
+            with os.scandir(path) as it:
+                return sum(entry.stat().st_size for entry in it)
+        except OSError:
+            # Evicted by another render meanwhile
+            return 0
+
+    def get_total_size(self) -> int:
+        return sum(self.get_entry_size(entry.path) for entry in self.get_entries())
+
+    # Marks the entry as just used
+    def touch(self, path: str) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def remove_entry(self, path: str) -> None:
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # To be called once an entry is written at path, replacing one of
+    # old_size bytes (0 for a new entry)
+    def add_entry(self, path: str, old_size: int = 0) -> None:
+        with self.lock:
+            if self.size is None:
+                self.size = self.get_total_size()
+            else:
+                self.size += self.get_entry_size(path) - old_size
+            if self.size > self.max_size:
+                self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in self.get_entries():
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+        entries.sort()
+        sizes = [self.get_entry_size(path) for _, path in entries]
+        self.size = sum(sizes)
+        for (_, path), size in zip(entries, sizes):
+            if self.size <= self.max_size:
+                break
+            self.remove_entry(path)
+            self.size -= size
+            self.evictions += 1
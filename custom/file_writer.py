@@ -0,0 +1,299 @@
+import os
+import queue
+import subprocess
+import threading
+import time
+
+import OpenGL.GL as gl
+
+from manimlib import *
+from manimlib.config import get_custom_config
+from manimlib.logger import log
+from manimlib.scene.scene_file_writer import SceneFileWriter
+
+from custom import profiler
+
+
+def get_encoder_config() -> dict:
+    return {
+        "threaded": True,
+        "queue_depth": 4,
+        "min_still_frames": 30,
+        **(get_custom_config().get("encoder") or {}),
+    }
+
+
+# SceneFileWriter (Scene File Writer Extended) which writes to ffmpeg on
+# its own thread, so the next frame is rendered while the last one is
+# piped and encoded.
+#
+# Frames are read back from the framebuffer straight into one of
+# queue_depth preallocated buffers, which go through a queue to the
+# encoder thread and back once written, so nothing is copied between
+# readback and the pipe. When all buffers are in use, rendering waits;
+# the time spent waiting on each side is logged at the end. When
+# custom.profiler is on, the encoder thread records its pipe writes under
+# "encode".
+#
+# The rawvideo pipe can't repeat a frame, so a frame held for at least
+# min_still_frames frames (see write_still_frames) is not piped again for
+# each of them. The pipe is closed, the frame is encoded once into a
+# segment of its own repeating it (ffmpeg's loop filter, with the pipe's
+# command line otherwise), and a new pipe is opened for what follows.
+# When the movie file is closed, its segments are joined with the concat
+# demuxer, copying the streams without encoding them again.
+class SceneFileWriterX(SceneFileWriter):
+    def __init__(self, scene, **kwargs):
+        super().__init__(scene, **kwargs)
+        config = get_encoder_config()
+        self.threaded = config["threaded"]
+        self.queue_depth = max(int(config["queue_depth"]), 1)
+        self.min_still_frames = int(config["min_still_frames"])
+        self.buffer_size = None
+        self.free_buffers = None
+        self.pending_frames = None
+        self.encoder_thread = None
+        self.encoder_error = None
+        self.pipe_command = None
+        self.segment_paths = []
+        self.frames_in_pipe = 0
+        self.num_frames = 0
+        self.num_still_frames = 0
+        self.render_stall_time = 0
+        self.encoder_idle_time = 0
+
+    def get_frame_size(self, camera: Camera) -> int:
+        return camera.pixel_width * camera.pixel_height * camera.n_channels
+
+    def open_movie_pipe(self, file_path: str) -> None:
+        super().open_movie_pipe(file_path)
+        # Segments are encoded with the same command line, so they can be
+        # joined without encoding them again
+        self.pipe_command = list(self.writing_process.args)
+        self.segment_paths = []
+        self.frames_in_pipe = 0
+        self.start_encoder_thread()
+
+    def start_encoder_thread(self) -> None:
+        if not self.threaded:
+            return
+        self.pending_frames = queue.Queue(maxsize=self.queue_depth)
+        self.encoder_error = None
+        self.encoder_thread = threading.Thread(
+            target=self.encode_frames,
+            args=(self.writing_process.stdin, self.pending_frames),
+            daemon=True,
+        )
+        self.encoder_thread.start()
+
+    def stop_encoder_thread(self) -> None:
+        if self.encoder_thread is not None:
+            self.pending_frames.put(None)
+            self.encoder_thread.join()
+            self.encoder_thread = None
+
+    def close_movie_pipe(self) -> None:
+        self.stop_encoder_thread()
+        try:
+            if self.segment_paths:
+                self.end_segment()
+                self.join_segments(self.temp_file_path)
+            super().close_movie_pipe()
+        finally:
+            self.raise_encoder_error()
+
+    # The pipe's command line, writing to output_path and with
+    # extra_filter after its own video filters
+    def get_segment_command(self, output_path: str, extra_filter: str | None = None) -> list[str]:
+        command = list(self.pipe_command)
+        command[-1] = output_path
+        if extra_filter is not None:
+            if "-vf" in command:
+                index = command.index("-vf") + 1
+                command[index] = f"{command[index]},{extra_filter}"
+            else:
+                command[-1:-1] = ["-vf", extra_filter]
+        return command
+
+    def get_segment_path(self) -> str:
+        stem, extension = os.path.splitext(self.final_file_path)
+        return f"{stem}_segment{len(self.segment_paths)}{extension}"
+
+    # Closes the pipe, keeping what it encoded as the next segment
+    def end_segment(self) -> None:
+        self.stop_encoder_thread()
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.raise_encoder_error()
+        if self.frames_in_pipe > 0:
+            path = self.get_segment_path()
+            os.replace(self.temp_file_path, path)
+            self.segment_paths.append(path)
+        elif os.path.exists(self.temp_file_path):
+            os.remove(self.temp_file_path)
+
+    def start_segment(self) -> None:
+        self.writing_process = subprocess.Popen(
+            self.get_segment_command(self.temp_file_path),
+            stdin=subprocess.PIPE,
+        )
+        self.frames_in_pipe = 0
+        self.start_encoder_thread()
+
+    # Encodes one frame shown num_frames times as the next segment,
+    # returns whether ffmpeg succeeded
+    def encode_still_segment(self, frame_data: bytes, num_frames: int) -> bool:
+        path = self.get_segment_path()
+        result = subprocess.run(
+            self.get_segment_command(path, f"loop=loop={num_frames - 1}:size=1"),
+            input=frame_data,
+        )
+        if result.returncode != 0:
+            log.warning("Encoding a held frame failed, piping its %d frames instead", num_frames)
+            if os.path.exists(path):
+                os.remove(path)
+            return False
+        self.segment_paths.append(path)
+        return True
+
+    # Joins the segments (concat demuxer, streams copied) into output_path
+    def join_segments(self, output_path: str) -> None:
+        list_path = os.path.splitext(output_path)[0] + "_segments.txt"
+        with open(list_path, "w", encoding="utf-8") as file:
+            for path in self.segment_paths:
+                quoted = os.path.abspath(path).replace("'", "'\\''")
+                file.write(f"file '{quoted}'\n")
+        try:
+            subprocess.run(
+                [
+                    self.pipe_command[0], "-y",
+                    "-f", "concat", "-safe", "0",
+                    "-i", list_path,
+                    "-c", "copy",
+                    "-loglevel", "error",
+                    output_path,
+                ],
+                check=True,
+            )
+        finally:
+            os.remove(list_path)
+        for path in self.segment_paths:
+            os.remove(path)
+        self.segment_paths = []
+
+    # Writes a frame which is shown for num_frames frames, as a segment
+    # when that's long enough to be worth two more ffmpeg runs
+    def write_still_frames(self, frame_data: bytes, num_frames: int) -> None:
+        if not self.write_to_movie or num_frames == 0:
+            return
+        if num_frames >= self.min_still_frames and self.movie_file_extension != ".gif":
+            self.end_segment()
+            encoded = self.encode_still_segment(frame_data, num_frames)
+            self.start_segment()
+            if encoded:
+                self.num_still_frames += num_frames
+                if getattr(self, "has_progress_display", False):
+                    self.progress_display.update(num_frames)
+                return
+        for _ in range(num_frames):
+            self.write_frame_data(frame_data)
+
+    def encode_frames(self, pipe, pending_frames: queue.Queue) -> None:
+        while True:
+            start = time.perf_counter()
+            item = pending_frames.get()
+            self.encoder_idle_time += time.perf_counter() - start
+            if item is None:
+                return
+            frame, is_pooled = item
+            try:
+                if self.encoder_error is None:
+                    start = time.perf_counter()
+                    pipe.write(frame)
+                    active_profiler = profiler.PROFILER
+                    if active_profiler is not None:
+                        active_profiler.record("encode", "encoder thread pipe.write", start)
+            except Exception as error:
+                self.encoder_error = error
+            finally:
+                if is_pooled:
+                    self.free_buffers.put(frame)
+
+    def raise_encoder_error(self) -> None:
+        if self.encoder_error is not None:
+            error, self.encoder_error = self.encoder_error, None
+            raise error
+
+    def get_free_buffer(self, camera: Camera) -> bytearray:
+        size = self.get_frame_size(camera)
+        if self.buffer_size != size:
+            self.buffer_size = size
+            self.free_buffers = queue.Queue()
+            for _ in range(self.queue_depth):
+                self.free_buffers.put(bytearray(size))
+        start = time.perf_counter()
+        buffer = self.free_buffers.get()
+        self.render_stall_time += time.perf_counter() - start
+        return buffer
+
+    def put_frame(self, frame, is_pooled: bool) -> None:
+        self.raise_encoder_error()
+        start = time.perf_counter()
+        self.pending_frames.put((frame, is_pooled))
+        self.render_stall_time += time.perf_counter() - start
+        self.num_frames += 1
+        self.frames_in_pipe += 1
+        if getattr(self, "has_progress_display", False):
+            self.progress_display.update()
+
+    def write_frame(self, camera: Camera) -> None:
+        if not self.write_to_movie or self.encoder_thread is None:
+            super().write_frame(camera)
+            if self.write_to_movie:
+                self.frames_in_pipe += 1
+            return
+        buffer = self.get_free_buffer(camera)
+        self.read_frame_into(camera, buffer)
+        self.put_frame(buffer, is_pooled=True)
+
+    # Camera.get_raw_fbo_data, reading into buffer instead of new bytes
+    def read_frame_into(self, camera: Camera, buffer: bytearray) -> None:
+        if hasattr(camera, "draw_fbo"):
+            camera.ctx.copy_framebuffer(camera.draw_fbo, camera.fbo)
+            fbo = camera.draw_fbo
+        else:
+            # Resolve the multisampled framebuffer, as Camera does
+            pw, ph = (camera.pixel_width, camera.pixel_height)
+            gl.glBindFramebuffer(gl.GL_READ_FRAMEBUFFER, camera.fbo_msaa.glo)
+            gl.glBindFramebuffer(gl.GL_DRAW_FRAMEBUFFER, camera.fbo.glo)
+            gl.glBlitFramebuffer(0, 0, pw, ph, 0, 0, pw, ph, gl.GL_COLOR_BUFFER_BIT, gl.GL_LINEAR)
+            fbo = camera.fbo
+        fbo.read_into(
+            buffer,
+            viewport=fbo.viewport,
+            components=camera.n_channels,
+            dtype="f1",
+        )
+
+    # Writes frame bytes already read back, e.g. a frame held through a
+    # wait, without copying them into a pooled buffer
+    def write_frame_data(self, frame_data: bytes) -> None:
+        if not self.write_to_movie:
+            return
+        if self.encoder_thread is None:
+            self.writing_process.stdin.write(frame_data)
+            self.frames_in_pipe += 1
+            if getattr(self, "has_progress_display", False):
+                self.progress_display.update()
+            return
+        self.put_frame(frame_data, is_pooled=False)
+
+    def finish(self) -> None:
+        super().finish()
+        if self.num_still_frames > 0:
+            log.info("Encoded %d held frames as still segments instead of piping them", self.num_still_frames)
+        if self.num_frames > 0:
+            log.info(
+                "Encoder thread: %d frames, renderer waited %.2fs for buffers, encoder waited %.2fs for frames",
+                self.num_frames, self.render_stall_time, self.encoder_idle_time
+            )
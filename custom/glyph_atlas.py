@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+from manimlib import *
+from manimlib.utils.directories import get_temp_dir
+
+
+# Characters that only LaTeX can typeset
+TEX_SPECIAL_CHARS = set("\\$^_{}&%#~")
+
+# Size of one em in the units of dvisvgm's output for the 10pt template,
+# so atlas text gets the same size as compiled text
+TEX_EM = 10.0
+
+# Reference glyph sitting on the baseline, rendered around every glyph
+REFERENCE_CHAR = "M"
+
+
+def is_plain_text(text: str) -> bool:
+    return not any(char in TEX_SPECIAL_CHARS for char in text)
+
+
+# Exclusive lock on a file, held between processes. fcntl and msvcrt
+# each exist on one platform only
+@contextmanager
+def lock_file(path: str):
+    with open(path, "a+b") as file:
+        if os.name == "nt":
+            import msvcrt
+            file.seek(0)
+            while True:
+                try:
+                    # Gives up after about 10 seconds
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+            try:
+                yield
+            finally:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(file, fcntl.LOCK_EX)
+            yield
+
+
+# Per-glyph paths of one font, extracted once with Text and kept on disk
+# as a single points array (memory-mapped) plus an index of where each
+# glyph starts and ends, and how far it advances the pen. Coordinates
+# are in ems, relative to the pen position on the baseline.
+#
+# Points files are named after their content and never rewritten; the
+# index names the one it belongs to, so replacing the index is the only
+# step that publishes new glyphs. Extraction holds a file lock, so
+# parallel renders don't drop each other's glyphs.
+class GlyphAtlas:
+    def __init__(self, font: str, directory: str):
+        self.font = font
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        self.lock_path = os.path.join(directory, "atlas.lock")
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            self.index = meta["glyphs"]
+            self.points = np.load(os.path.join(self.directory, meta["points"]), mmap_mode="r")
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, or written by an older version
+            self.index = {}
+            self.points = np.zeros((0, 3))
+
+    def save(self, points: np.ndarray) -> None:
+        # Write then rename, so other renders never map half a file
+        suffix = f".{os.getpid()}.tmp"
+        points_name = "points_{}.npy".format(hashlib.sha256(points.tobytes()).hexdigest()[:16])
+        points_path = os.path.join(self.directory, points_name)
+        np.save(points_path + suffix + ".npy", points)
+        os.replace(points_path + suffix + ".npy", points_path)
+        with open(self.index_path + suffix, "w", encoding="utf-8") as file:
+            json.dump({"points": points_name, "glyphs": self.index}, file, ensure_ascii=False)
+        os.replace(self.index_path + suffix, self.index_path)
+
+        for file in os.listdir(self.directory):
+            if file.endswith(".npy") and file != points_name:
+                try:
+                    os.remove(os.path.join(self.directory, file))
+                except FileNotFoundError:
+                    pass
+
+    def get_left_edges(self, text: str) -> tuple[Text, list[float]]:
+        text_mob = Text(text, font=self.font)
+        return text_mob, [submob.get_left()[0] for submob in text_mob]
+
+    def extract_glyphs(self, chars: str) -> None:
+        # The distance between two reference glyphs is one advance of the
+        # reference, and a full width CJK glyph advances by one em
+        _, (x0, x1) = self.get_left_edges(REFERENCE_CHAR * 2)
+        reference_advance = x1 - x0
+        _, (x0, x1, x2) = self.get_left_edges(REFERENCE_CHAR + "中" + REFERENCE_CHAR)
+        em = x2 - x1
+
+        new_points = [np.array(self.points)]
+        start = len(self.points)
+        for char in chars:
+            text_mob = Text(REFERENCE_CHAR + char + REFERENCE_CHAR, font=self.font)
+            first, *glyph_parts, last = text_mob.submobjects
+            pen = np.array([first.get_left()[0] + reference_advance, first.get_bottom()[1], 0])
+            advance = last.get_left()[0] - first.get_left()[0] - reference_advance
+
+            points = np.vstack([
+                part.get_points() for part in glyph_parts
+            ]) if glyph_parts else np.zeros((0, 3))
+            points = (points - pen) / em
+            new_points.append(points)
+            self.index[char] = [start, start + len(points), advance / em]
+            start += len(points)
+        self.save(np.vstack(new_points))
+
+    def ensure_glyphs(self, text: str) -> None:
+        missing = "".join(dict.fromkeys(c for c in text if c not in self.index))
+        if not missing:
+            return
+        with self.lock, lock_file(self.lock_path):
+            self.load()
+            missing = "".join(c for c in missing if c not in self.index)
+            if missing:
+                self.extract_glyphs(missing)
+                self.load()
+
+    def has_ink(self, char: str) -> bool:
+        start, end, _ = self.index[char]
+        return end > start
+
+    # One VMobject per inked character, laid out on a single line
+    def get_glyph_mobjects(self, text: str, size: float = TEX_EM) -> list[VMobject]:
+        self.ensure_glyphs(text)
+        mobjects = []
+        pen_x = 0
+        for char in text:
+            start, end, advance = self.index[char]
+            if end > start:
+                glyph = VMobject()
+                glyph.set_points(self.points[start:end] * size + [pen_x, 0, 0])
+                mobjects.append(glyph)
+            pen_x += advance * size
+        return mobjects
+
+
+GLYPH_ATLASES = {}
+
+
+def get_glyph_atlas(font: str) -> GlyphAtlas:
+    if font not in GLYPH_ATLASES:
+        font_hash = hashlib.sha256(font.encode()).hexdigest()[:16]
+        directory = os.path.join(get_temp_dir(), "glyph_atlas", font_hash)
+        GLYPH_ATLASES[font] = GlyphAtlas(font, directory)
+    return GLYPH_ATLASES[font]
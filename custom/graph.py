@@ -0,0 +1,756 @@
+import argparse
+import atexit
+import hashlib
+import os
+import sys
+import threading
+import time
+from types import CodeType
+from types import FunctionType
+from types import ModuleType
+from typing import Callable
+
+from manimlib import *
+from manimlib.config import get_camera_configuration
+from manimlib.config import get_configuration
+from manimlib.config import get_custom_config
+from manimlib.logger import log
+from manimlib.utils.directories import get_temp_dir
+
+from custom.disk_cache import DiskCache
+from custom.updaters import get_dependency_sources
+from custom.updaters import get_skipping_updater
+
+
+# Output resolution of the current manimgl run, found once per process
+CAMERA_RESOLUTION = None
+
+
+def set_camera_resolution(pixel_width: int, pixel_height: int) -> None:
+    global CAMERA_RESOLUTION
+    CAMERA_RESOLUTION = (pixel_width, pixel_height)
+
+
+# manimgl imports the scene file from get_configuration(), before it builds
+# the camera config, so module level graphs take the resolution from the
+# arguments manimgl parsed there; SceneX sets it from its camera. Outside
+# of manimgl, it is the default quality of the config.
+def get_camera_resolution() -> tuple[int, int]:
+    if CAMERA_RESOLUTION is None:
+        set_camera_resolution(*find_camera_resolution())
+    return CAMERA_RESOLUTION
+
+
+def find_camera_resolution() -> tuple[int, int]:
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code is get_configuration.__code__:
+            camera_config = get_camera_configuration(frame.f_locals["args"], get_custom_config())
+            return camera_config["pixel_width"], camera_config["pixel_height"]
+        frame = frame.f_back
+    qualities = get_custom_config()["camera_qualities"]
+    width, height = qualities[qualities["default_quality"]]["resolution"].split("x")
+    return int(width), int(height)
+
+
+# Quadratic bezier points of a path through the anchors with straight
+# segments, laid out as add_points_as_corners() does, in one go
+def get_corner_points(anchors: np.ndarray) -> np.ndarray:
+    points = np.empty((3 * (len(anchors) - 1), 3))
+    points[0::3] = anchors[:-1]
+    points[1::3] = 0.5 * (anchors[:-1] + anchors[1:])
+    points[2::3] = anchors[1:]
+    return points
+
+
+# Start and end of each path of ParametricCurve.init_points()
+def get_path_bounds(t_range, discontinuities, epsilon: float = 1e-8) -> list[tuple[float, float]]:
+    t_min, t_max, _ = t_range
+    jumps = np.array(discontinuities, dtype=float)
+    jumps = jumps[(jumps > t_min) & (jumps < t_max)]
+    boundary_times = [t_min, t_max, *(jumps - epsilon), *(jumps + epsilon)]
+    boundary_times.sort()
+    return list(zip(boundary_times[0::2], boundary_times[1::2]))
+
+
+# Explicit discontinuities with the detected ones added, leaving out those
+# within 2 * epsilon of an explicit one: bisection puts a pole a few
+# epsilon away from its exact place, and both together would leave a
+# tiny path across the pole
+def merge_discontinuities(explicit, detected, epsilon: float = 1e-8) -> list[float]:
+    explicit = sorted(explicit)
+    return sorted([
+        *explicit,
+        *(
+            x for x in detected
+            if all(abs(x - y) > 2 * epsilon for y in explicit)
+        ),
+    ])
+
+
+# Samples of ParametricCurve.init_points(), one array per path
+def get_sample_paths(t_range, discontinuities, epsilon: float = 1e-8) -> list[np.ndarray]:
+    step = t_range[2]
+    return [
+        np.array([*np.arange(t1, t2, step), t2])
+        for t1, t2 in get_path_bounds(t_range, discontinuities, epsilon)
+    ]
+
+
+# Calls the function on the whole array, and point by point if it
+# raises or doesn't give one value per x (unless strict)
+def evaluate_function(function: Callable, xs: np.ndarray, strict: bool = False) -> np.ndarray:
+    try:
+        with np.errstate(all="ignore"):
+            ys = np.asarray(function(xs), dtype=float)
+        if ys.shape == ():
+            return np.full(xs.shape, float(ys))
+        if ys.shape == xs.shape:
+            return ys
+        error = ValueError(
+            f"Graph function returned shape {ys.shape} for {xs.shape[0]} samples"
+        )
+    except Exception as e:
+        error = e
+    if strict:
+        raise error
+    return np.array([function(x) for x in xs], dtype=float)
+
+
+# Splits a path where the function is not finite (nan, inf), dropping
+# those samples
+def split_non_finite(xs: np.ndarray, ys: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+    finite = np.isfinite(ys)
+    if finite.all():
+        return [(xs, ys)]
+    edges = np.flatnonzero(np.diff(finite.astype(int))) + 1
+    return [
+        (x, y)
+        for x, y in zip(np.split(xs, edges), np.split(ys, edges))
+        if len(x) > 1 and np.isfinite(y).all()
+    ]
+
+
+# Poles found by AxesX.find_poles(), per function key (get_function_key:
+# bytecode and the values it reads) and x range. Functions without a key
+# are searched every time.
+DETECTED_POLES = {}
+
+
+PLAIN_TYPES = (int, float, complex, str, bool, type(None), np.number)
+
+
+def get_code_key(code: CodeType) -> tuple:
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            get_code_key(const) if isinstance(const, CodeType) else const
+            for const in code.co_consts
+        ),
+    )
+
+
+def get_code_names(code: CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= get_code_names(const)
+    return names
+
+
+# Modules whose functions are taken to be stable, and keyed by name
+LIBRARY_MODULES = ("manimlib", "numpy", "math", "cmath", "builtins", "scipy")
+
+
+class NotPlain(Exception):
+    pass
+
+
+def get_value_key(value, seen: set[int]):
+    if isinstance(value, PLAIN_TYPES):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(get_value_key(v, seen) for v in value)
+    if isinstance(value, ModuleType):
+        return ("module", value.__name__)
+    module = (getattr(value, "__module__", None) or "").split(".")[0]
+    if callable(value) and module in LIBRARY_MODULES:
+        return ("library", module, getattr(value, "__qualname__", getattr(value, "__name__", "")))
+    if not isinstance(value, FunctionType):
+        raise NotPlain(type(value).__name__)
+
+    if id(value) in seen:
+        return ("recursion", value.__qualname__)
+    seen.add(id(value))
+    code = value.__code__
+    try:
+        closure = tuple(cell.cell_contents for cell in value.__closure__ or ())
+    except ValueError:
+        raise NotPlain("empty closure cell")
+    module_globals = value.__globals__
+    global_values = tuple(
+        (name, module_globals[name])
+        for name in sorted(get_code_names(code))
+        if name in module_globals
+    )
+    return (
+        "function",
+        get_code_key(code),
+        get_value_key(closure, seen),
+        get_value_key(value.__defaults__ or (), seen),
+        tuple((name, get_value_key(v, seen)) for name, v in global_values),
+    )
+
+
+# Hash of what a function computes: its bytecode, plus the values it
+# reads from closures, defaults and module globals, following into the
+# Python functions it calls. None when one of those is not a plain value
+# (a mobject, a tracker...), as the result could then change without the
+# hash changing.
+def get_function_key(function: Callable) -> str | None:
+    if not isinstance(function, FunctionType):
+        return None
+    try:
+        seed = get_value_key(function, set())
+    except NotPlain:
+        return None
+    return hashlib.sha256(repr(seed).encode()).hexdigest()[:32]
+
+
+# Memo of sampled graphs, in memory and as .npz files under temp/graph_cache.
+# Entries are stored with the tolerance they were sampled to, and are
+# reused for any equal or coarser tolerance, so a 4K render also serves
+# the previews that come after it. Files are evicted least recently used
+# first past max_size_mb, see DiskCache; what is already in memory stays.
+class GraphCache(DiskCache):
+    def __init__(self, directory: str, max_size: int):
+        super().__init__(directory, max_size)
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npz")
+
+    def load(self, key: str):
+        path = self.get_path(key)
+        try:
+            with np.load(path) as data:
+                entry = (
+                    float(data["tolerance"]),
+                    data["discontinuities"].tolist(),
+                    [
+                        (data[f"xs_{i}"], data[f"ys_{i}"])
+                        for i in range(int(data["num_paths"]))
+                    ],
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+        self.touch(path)
+        return entry
+
+    def get(self, key: str, tolerance: float):
+        with self.lock:
+            if key not in self.entries:
+                entry = self.load(key)
+                if entry is not None:
+                    self.entries[key] = entry
+            entry = self.entries.get(key)
+            if entry is None or entry[0] > tolerance:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: str, tolerance: float, discontinuities: list[float], samples) -> None:
+        with self.lock:
+            self.entries[key] = (tolerance, discontinuities, samples)
+        arrays = {
+            "tolerance": tolerance,
+            "discontinuities": np.array(discontinuities, dtype=float),
+            "num_paths": len(samples),
+        }
+        for i, (xs, ys) in enumerate(samples):
+            arrays[f"xs_{i}"] = xs
+            arrays[f"ys_{i}"] = ys
+        # Write then rename, so parallel renders never read half a file
+        path = self.get_path(key)
+        old_size = self.get_entry_size(path) if os.path.exists(path) else 0
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temp_path, path)
+        self.add_entry(path, old_size)
+
+
+def get_graph_cache_config() -> dict:
+    return {
+        "enabled": True,
+        "max_size_mb": 64,
+        **(get_custom_config().get("graph_cache") or {}),
+    }
+
+
+def log_graph_cache_stats() -> None:
+    if GRAPH_CACHE.hits or GRAPH_CACHE.misses:
+        log.info(
+            "Graph cache: %d hits, %d misses, %d evictions",
+            GRAPH_CACHE.hits, GRAPH_CACHE.misses, GRAPH_CACHE.evictions
+        )
+
+
+_graph_cache_config = get_graph_cache_config()
+
+# Left as None when disabled, so nothing under temporary_storage is touched
+GRAPH_CACHE = None
+
+if _graph_cache_config["enabled"]:
+    GRAPH_CACHE = GraphCache(
+        os.path.join(get_temp_dir(), "graph_cache"),
+        max_size=int(_graph_cache_config["max_size_mb"] * 1024 * 1024),
+    )
+    atexit.register(log_graph_cache_stats)
+
+
+# A ParametricCurve whose points were sampled beforehand, see AxesX.get_graph()
+class SampledCurve(ParametricCurve):
+    CONFIG = {
+        "sampled_paths": None,
+    }
+
+    def init_points(self):
+        if self.sampled_paths is None:
+            return super().init_points()
+        paths = [get_corner_points(path) for path in self.sampled_paths if len(path) > 1]
+        self.sampled_paths = None
+        if paths:
+            self.set_points(np.vstack(paths))
+        if self.use_smoothing:
+            self.make_approximately_smooth()
+        if not self.has_points():
+            self.set_points([self.t_func(self.t_range[0])])
+        return self
+
+
+# Dashed line from an axis to a point which follows the point by itself,
+# like always_redraw(lambda: axes.get_h_line(point)) but without a new
+# DashedLine every frame. The dashes are kept in a pool and only their
+# points are rewritten, in place while a dash has its 3 points; the pool
+# grows when the line needs more dashes than it ever had, and surplus
+# dashes are just left out.
+# Like the updaters of custom.updaters, it skips frames where the point
+# source and the axes are unchanged, so waits can hold still frames.
+class DashedReferenceLine(VMobject):
+    def __init__(
+        self,
+        axes: Axes,
+        axis_index: int,
+        point_source: Mobject | Callable[[], np.ndarray],
+        dash_length: float = DEFAULT_DASH_LENGTH,
+        positive_space_ratio: float = 0.5,
+        color: str = GREY_A,
+        stroke_width: float = 2,
+        **kwargs
+    ):
+        self.axes = axes
+        self.axis_index = axis_index
+        self.point_source = point_source
+        self.dash_length = dash_length
+        self.positive_space_ratio = positive_space_ratio
+        self.line_color = color
+        self.line_stroke_width = stroke_width
+        self.dash_pool = []
+        super().__init__(**kwargs)
+        self.update_dashes()
+        if isinstance(point_source, Mobject):
+            sources = get_dependency_sources([], [axes, point_source])
+        else:
+            sources = get_dependency_sources([point_source], [axes])
+        self.add_updater(get_skipping_updater(lambda m: m.update_dashes(), sources))
+
+    def get_target_point(self) -> np.ndarray:
+        if isinstance(self.point_source, Mobject):
+            return self.point_source.get_center()
+        return np.array(self.point_source())
+
+    def get_new_dash(self) -> VMobject:
+        dash = VMobject()
+        dash.set_points(np.zeros((3, 3)))
+        if self.submobjects:
+            dash.match_style(self.submobjects[0])
+        else:
+            dash.set_stroke(self.line_color, self.line_stroke_width)
+        return dash
+
+    def update_dashes(self):
+        # A copy shares the pool list with the original, so it takes its
+        # own dashes back
+        if self.dash_pool[:len(self.submobjects)] != self.submobjects:
+            self.dash_pool = list(self.submobjects)
+
+        end = self.get_target_point()
+        start = self.axes.get_axis(self.axis_index).get_projection(end)
+        full_length = self.dash_length / self.positive_space_ratio
+        num_dashes = int(np.ceil(get_norm(end - start) / full_length))
+        while len(self.dash_pool) < num_dashes:
+            self.dash_pool.append(self.get_new_dash())
+        if len(self.submobjects) != num_dashes:
+            self.set_submobjects(self.dash_pool[:num_dashes])
+        if num_dashes == 0:
+            return self
+
+        # Same dash positions as DashedVMobject
+        partial_d_alpha = self.positive_space_ratio / num_dashes
+        alphas = np.linspace(0, 1, num_dashes + 1)[:-1]
+        alphas /= (1 - 1 / num_dashes + partial_d_alpha)
+        starts = interpolate(start, end, alphas[:, np.newaxis])
+        ends = interpolate(start, end, np.minimum(alphas + partial_d_alpha, 1)[:, np.newaxis])
+        for dash, dash_start, dash_end in zip(self.submobjects, starts, ends):
+            dash_points = [dash_start, 0.5 * (dash_start + dash_end), dash_end]
+            # A dash is one straight curve, unless something (e.g. a
+            # Transform or match_points) changed its number of points
+            if dash.get_num_points() == 3:
+                dash.data["points"][:] = dash_points
+            else:
+                dash.set_points(np.array(dash_points))
+        self.refresh_bounding_box(recurse_down=True)
+        return self
+
+
+# Axes (Axes Extended) with faster graphs. get_graph() evaluates the
+# function on all samples at once and maps them to points with one
+# affine transform, instead of a c2p() call per sample.
+#
+#     axes.get_graph(lambda x: x ** 2)                         # array, else per point
+#     axes.get_graph(lambda x: np.sqrt(x), vectorized="strict")  # array only
+#     axes.get_graph(lambda x: math.sqrt(x), vectorized=False)   # per point
+#
+# With adaptive sampling, each path starts from a few samples per tick,
+# and segments are halved (in vectorized rounds) while the function at
+# their middle is further than graph_tolerance pixels of the output
+# resolution from their chord. Flat parts stay coarse, curved parts and
+# the neighbourhood of poles get dense, and previews get fewer points
+# than 4K renders.
+class AxesX(Axes):
+    CONFIG = {
+        "vectorized_graphs": True,
+        "adaptive_graphs": True,
+        # Screen space error in pixels
+        "graph_tolerance": 0.5,
+        "graph_samples_per_tick": 4,
+        "graph_max_refinements": 10,
+        # Find poles where the function flips sign and blows up, and split
+        # the graph there, as if they were passed as discontinuities
+        "detect_graph_discontinuities": False,
+        # Blowing up means beyond this many times the y range
+        "pole_threshold": 1000,
+    }
+
+    def get_t_range(self, x_range=None) -> np.ndarray:
+        t_range = np.array(self.x_range, dtype=float)
+        if x_range is not None:
+            t_range[:len(x_range)] = x_range
+        # For axes, the third coordinate of x_range indicates
+        # tick frequency.  But for functions, it indicates a
+        # sample frequency
+        if x_range is None or len(x_range) < 3:
+            t_range[2] /= self.num_sampled_graph_points_per_tick
+        return t_range
+
+    # c2p for arrays of coordinates; the axes are linear, so it is affine
+    def coords_to_points(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        origin = self.c2p(0, 0)
+        x_unit = self.c2p(1, 0) - origin
+        y_unit = self.c2p(0, 1) - origin
+        return origin + np.outer(xs, x_unit) + np.outer(ys, y_unit)
+
+    # Inverse of coords_to_points() for the x coordinate
+    def points_to_xs(self, points: np.ndarray) -> np.ndarray:
+        origin = self.c2p(0, 0)
+        x_unit = self.c2p(1, 0) - origin
+        return np.dot(points - origin, x_unit) / np.dot(x_unit, x_unit)
+
+    # Curve end points of each path of the graph with their x values,
+    # sorted by x within the path. Kept on the graph and rebuilt when the
+    # data_version of the graph or of the axes changes, so checking the
+    # table is O(1) and lookups are a binary search.
+    def get_graph_x_tables(self, graph: VMobject) -> list[tuple[np.ndarray, np.ndarray]]:
+        key = (id(self), self.data_version, graph.data_version)
+        cached = getattr(graph, "x_tables", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        tables = []
+        for path in graph.get_subpaths():
+            anchors = np.vstack([path[0::3], path[-1:]])
+            xs = self.points_to_xs(anchors)
+            order = np.argsort(xs, kind="stable")
+            tables.append((xs[order], anchors[order]))
+        graph.x_tables = (key, tables)
+        return tables
+
+    # Graphs with an underlying function are evaluated directly, others
+    # are looked up in the x table of the path containing x (instead of a
+    # binary search over point_from_proportion) and interpolated between
+    # its end points. Paths are never bridged, so x in the gap of a
+    # discontinuity has no point, like x outside the graph.
+    def input_to_graph_point(self, x: float, graph: VMobject) -> np.ndarray | None:
+        if hasattr(graph, "underlying_function"):
+            return super().input_to_graph_point(x, graph)
+        if not graph.has_points():
+            return None
+        for xs, anchors in self.get_graph_x_tables(graph):
+            if not xs[0] <= x <= xs[-1]:
+                continue
+            index = int(np.clip(np.searchsorted(xs, x), 1, len(xs) - 1))
+            x0, x1 = xs[index - 1], xs[index]
+            alpha = 0 if x1 == x0 else (x - x0) / (x1 - x0)
+            return interpolate(anchors[index - 1], anchors[index], alpha)
+        return None
+
+    i2gp = input_to_graph_point
+
+    # Self-updating variants of get_v_line() and get_h_line(), following a
+    # mobject (its center) or a function returning a point
+    def get_v_line_to(self, point_source, **kwargs) -> DashedReferenceLine:
+        return DashedReferenceLine(self, 0, point_source, **kwargs)
+
+    def get_h_line_to(self, point_source, **kwargs) -> DashedReferenceLine:
+        return DashedReferenceLine(self, 1, point_source, **kwargs)
+
+    def get_graph_tolerance(self) -> float:
+        pixel_width, _ = get_camera_resolution()
+        return self.graph_tolerance * FRAME_WIDTH / pixel_width
+
+    # Samples of one path, refined until every segment is within
+    # tolerance of the function or out of view
+    def sample_adaptively(
+        self,
+        function: Callable,
+        t_min: float,
+        t_max: float,
+        step: float,
+        tolerance: float,
+        strict: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        xs = np.linspace(t_min, t_max, max(int(np.ceil((t_max - t_min) / step)), 1) + 1)
+        ys = evaluate_function(function, xs, strict)
+        y_min, y_max = self.y_range[:2]
+        margin = 0.5 * (y_max - y_min)
+        active = np.ones(len(xs) - 1, dtype=bool)
+
+        for _ in range(self.graph_max_refinements):
+            indices = np.flatnonzero(active)
+            mid_xs = 0.5 * (xs[indices] + xs[indices + 1])
+            mid_ys = evaluate_function(function, mid_xs, strict)
+
+            chord_ys = 0.5 * (ys[indices] + ys[indices + 1])
+            error = np.linalg.norm(
+                self.coords_to_points(mid_xs, mid_ys) - self.coords_to_points(mid_xs, chord_ys),
+                axis=1,
+            )
+            segment_ys = np.array([ys[indices], ys[indices + 1], mid_ys])
+            out_of_view = (
+                (segment_ys > y_max + margin).all(axis=0)
+                | (segment_ys < y_min - margin).all(axis=0)
+            )
+            refine = (error > tolerance) & ~out_of_view
+            if not refine.any():
+                break
+
+            # Both halves of a refined segment stay active
+            split = indices[refine] + 1
+            xs = np.insert(xs, split, mid_xs[refine])
+            ys = np.insert(ys, split, mid_ys[refine])
+            active = np.zeros(len(xs) - 1, dtype=bool)
+            new_indices = split + np.arange(len(split))
+            active[new_indices - 1] = True
+            active[new_indices] = True
+        return xs, ys
+
+    # Sign flips between x - epsilon and x + epsilon, with the function
+    # blowing up (or not finite) on both sides
+    def is_pole(self, function: Callable, xs: np.ndarray, epsilon: float, strict: bool = False) -> np.ndarray:
+        left = evaluate_function(function, xs - epsilon, strict)
+        right = evaluate_function(function, xs + epsilon, strict)
+        threshold = self.pole_threshold * (self.y_range[1] - self.y_range[0])
+        with np.errstate(invalid="ignore"):
+            blows_up = ~np.isfinite(left) | ~np.isfinite(right) | (
+                (np.abs(left) > threshold) & (np.abs(right) > threshold)
+            )
+            return blows_up & (np.sign(left) * np.sign(right) <= 0)
+
+    # Sign changes between uniform samples, narrowed down by bisection,
+    # which turn out to be poles rather than zeros
+    def find_poles(self, function: Callable, t_range: np.ndarray, epsilon: float, strict: bool = False) -> list[float]:
+        function_key = get_function_key(function)
+        key = None
+        if function_key is not None:
+            key = (function_key, *t_range[:3], epsilon, self.pole_threshold, *self.y_range[:2])
+            if key in DETECTED_POLES:
+                return DETECTED_POLES[key]
+
+        xs = get_sample_paths(t_range, [], epsilon)[0]
+        ys = evaluate_function(function, xs, strict)
+        with np.errstate(invalid="ignore"):
+            flips = np.flatnonzero(np.sign(ys[:-1]) * np.sign(ys[1:]) < 0)
+        lo, hi, y_lo = xs[flips], xs[flips + 1], ys[flips]
+        while len(lo) > 0 and (hi - lo).max() > epsilon:
+            mid = 0.5 * (lo + hi)
+            y_mid = evaluate_function(function, mid, strict)
+            same_side = np.sign(y_mid) == np.sign(y_lo)
+            lo = np.where(same_side, mid, lo)
+            y_lo = np.where(same_side, y_mid, y_lo)
+            hi = np.where(same_side, hi, mid)
+
+        candidates = 0.5 * (lo + hi)
+        poles = [] if len(candidates) == 0 else candidates[self.is_pole(function, candidates, epsilon, strict)].tolist()
+        if key is not None:
+            DETECTED_POLES[key] = poles
+        return poles
+
+    def get_graph_samples(
+        self,
+        function: Callable,
+        t_range: np.ndarray,
+        discontinuities,
+        epsilon: float,
+        strict: bool = False,
+        tolerance: float | None = None,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        if tolerance is None:
+            return [
+                (xs, evaluate_function(function, xs, strict))
+                for xs in get_sample_paths(t_range, discontinuities, epsilon)
+            ]
+        step = t_range[2] * self.num_sampled_graph_points_per_tick / self.graph_samples_per_tick
+        return [
+            self.sample_adaptively(function, t1, t2, step, tolerance, strict)
+            for t1, t2 in get_path_bounds(t_range, discontinuities, epsilon)
+        ]
+
+    # Everything besides the function that the samples depend on
+    def get_graph_cache_key(self, function: Callable, *settings) -> str | None:
+        function_key = get_function_key(function)
+        if function_key is None:
+            return None
+        origin = self.c2p(0, 0)
+        seed = (
+            function_key,
+            tuple(self.y_range),
+            round(get_norm(self.c2p(1, 0) - origin), 6),
+            round(get_norm(self.c2p(0, 1) - origin), 6),
+            self.num_sampled_graph_points_per_tick,
+            self.graph_samples_per_tick,
+            self.graph_max_refinements,
+            self.pole_threshold,
+            *settings,
+        )
+        return hashlib.sha256(repr(seed).encode()).hexdigest()[:32]
+
+    def get_graph(
+        self,
+        function: Callable[[float], float],
+        x_range=None,
+        vectorized: bool | str | None = None,
+        adaptive: bool | None = None,
+        detect_discontinuities: bool | None = None,
+        **kwargs
+    ) -> ParametricCurve:
+        if vectorized is None:
+            vectorized = self.vectorized_graphs
+        if not vectorized:
+            return super().get_graph(function, x_range, **kwargs)
+        if adaptive is None:
+            # An explicit sample step is taken as it is
+            adaptive = self.adaptive_graphs and (x_range is None or len(x_range) < 3)
+        if detect_discontinuities is None:
+            detect_discontinuities = self.detect_graph_discontinuities
+
+        t_range = self.get_t_range(x_range)
+        epsilon = kwargs.get("epsilon", 1e-8)
+        strict = (vectorized == "strict")
+        discontinuities = sorted(kwargs.get("discontinuities", []))
+        tolerance = self.get_graph_tolerance() if adaptive else None
+
+        cache_key = None
+        if GRAPH_CACHE is not None:
+            cache_key = self.get_graph_cache_key(
+                function, tuple(t_range), epsilon, tuple(discontinuities),
+                adaptive, detect_discontinuities,
+            )
+        cached = None
+        if cache_key is not None:
+            cached = GRAPH_CACHE.get(cache_key, tolerance or 0.0)
+
+        if cached is not None:
+            discontinuities, samples = cached
+        else:
+            if detect_discontinuities:
+                discontinuities = merge_discontinuities(
+                    discontinuities,
+                    self.find_poles(function, t_range, epsilon, strict),
+                    epsilon,
+                )
+            samples = self.get_graph_samples(
+                function, t_range, discontinuities, epsilon,
+                strict=strict,
+                tolerance=tolerance,
+            )
+            if detect_discontinuities:
+                samples = [part for xs, ys in samples for part in split_non_finite(xs, ys)]
+            if cache_key is not None:
+                GRAPH_CACHE.put(cache_key, tolerance or 0.0, discontinuities, samples)
+
+        kwargs["discontinuities"] = discontinuities
+        graph = SampledCurve(
+            lambda t: self.c2p(t, function(t)),
+            t_range=t_range,
+            sampled_paths=[self.coords_to_points(xs, ys) for xs, ys in samples],
+            **kwargs
+        )
+        graph.underlying_function = function
+        return graph
+
+
+# Times the graph rebuilds observe() in properties_of_a_function.py used
+# to make, one graph per 0.01 of a, b and c:
+#
+#     python -m custom.graph
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark AxesX.get_graph against Axes.get_graph")
+    parser.add_argument("-n", "--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    axes_config = dict(x_range=(-4, 4), y_range=(-4, 4), width=6, height=6)
+    families = [
+        (lambda a: (lambda x: a * x - 0.25 + 1 / x), 1, 2, 100),
+        (lambda a: (lambda x: a * x - 0.25 + 1 / x), 2, -1, 300),
+        (lambda c: (lambda x: -x - 0.25 + c / x), 1, 2, 100),
+        (lambda c: (lambda x: -x - 0.25 + c / x), 2, -1, 300),
+        (lambda b: (lambda x: -x + b - 1 / x), -0.25, -1.25, 100),
+        (lambda b: (lambda x: -x + b - 1 / x), -1.25, 0.75, 200),
+        (lambda b: (lambda x: -x + b - 1 / x), 0.75, -0.25, 100),
+    ]
+
+    def run(axes, **kwargs) -> float:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for family, p0, p1, steps in families:
+                for value in np.linspace(p0, p1, steps + 1)[1:]:
+                    axes.get_graph(family(value), discontinuities=[0], **kwargs)
+        return time.perf_counter() - start
+
+    num_graphs = args.repeat * sum(steps for *_, steps in families)
+    results = [
+        ("Axes.get_graph", run(Axes(**axes_config))),
+        ("AxesX.get_graph", run(AxesX(**axes_config), adaptive=False)),
+        ("AxesX.get_graph adaptive", run(AxesX(**axes_config))),
+    ]
+    print(f"{num_graphs} graphs")
+    for name, seconds in results:
+        print(f"{name:<28}{seconds:8.3f}s{1000 * seconds / num_graphs:10.3f}ms/graph")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from manimlib import *
+
+# Installs the init_svg_mobject which serializes builds of the same svg
+# across the worker threads
+import custom.tex_cache
+
+
+TEX_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="tex")
+
+# Builds in flight, by tex class, strings and kwargs: [future, number of
+# LazyTex sharing it, whether one has taken the result]
+IN_FLIGHT = {}
+IN_FLIGHT_LOCK = threading.Lock()
+
+
+# Placeholder for a tex mobject which is being built on a worker thread.
+# Passing it around (e.g. into ReplacementTransform) does not block; the
+# first call that needs its family, points or submobjects waits for the
+# compile and turns the placeholder into the real mobject in place, so
+# every reference to it stays valid.
+class LazyTex(VMobject):
+    def __init__(self, tex_class: type, *tex_strings: str, **kwargs):
+        self.future = None
+        super().__init__()
+        self.tex_class = tex_class
+        self.tex_strings = tex_strings
+        self.build_key = (tex_class, tex_strings, repr(sorted(kwargs.items())))
+        with IN_FLIGHT_LOCK:
+            entry = IN_FLIGHT.get(self.build_key)
+            if entry is None or entry[2]:
+                entry = [TEX_EXECUTOR.submit(tex_class, *tex_strings, **kwargs), 0, False]
+                IN_FLIGHT[self.build_key] = entry
+            entry[1] += 1
+        self.build = entry
+        self.future = entry[0]
+
+    def resolve(self) -> Mobject:
+        if self.future is None:
+            return self
+        future, self.future = self.future, None
+        mobject = future.result()
+        with IN_FLIGHT_LOCK:
+            # A shared build is copied, so each placeholder gets its own
+            if self.build[1] > 1:
+                mobject = mobject.copy()
+            self.build[2] = True
+            if IN_FLIGHT.get(self.build_key) is self.build:
+                del IN_FLIGHT[self.build_key]
+
+        parents = self.parents
+        self.__class__ = mobject.__class__
+        self.__dict__ = mobject.__dict__
+        self.parents = parents
+        for submob in self.submobjects:
+            submob.parents = [self if p is mobject else p for p in submob.parents]
+        self.assemble_family()
+        return self
+
+
+def _resolving(name: str):
+    def method(self, *args, **kwargs):
+        if self.future is not None:
+            self.resolve()
+            return getattr(self, name)(*args, **kwargs)
+        return getattr(super(LazyTex, self), name)(*args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in [
+    "get_family", "get_points", "has_points", "copy", "deepcopy",
+    "__getitem__", "__iter__", "__len__",
+]:
+    setattr(LazyTex, _name, _resolving(_name))
+
+
+# Starts compiling tex_class(*tex_strings, **kwargs) in the background
+def lazy_tex(tex_class: type, *tex_strings: str, **kwargs) -> LazyTex:
+    return LazyTex(tex_class, *tex_strings, **kwargs)
@@ -0,0 +1,121 @@
+from typing import Callable
+
+from manimlib import *
+
+from custom.graph import get_corner_points
+from custom.graph import get_sample_paths
+
+
+# Animates a graph through a family of functions f(x, *params), with
+# each parameter moving linearly from its start to its end value.
+#
+#     ParameterSweep(
+#         graph, axes,
+#         lambda x, a: a * x - 0.25 + 1 / x,
+#         {"a": (1, 2)},
+#         run_time=100 / 60,
+#     )
+#
+# The graph keeps its samples (the x_range and discontinuities it was
+# made with in axes.get_graph()). All y-values of the sweep, steps x
+# samples, are evaluated in one NumPy call when it begins, and each frame
+# writes its row into the graph's point buffer, instead of building a new
+# graph and a ReplacementTransform for every step.
+class ParameterSweep(Animation):
+    CONFIG = {
+        # Taken from the graph unless given
+        "x_range": None,
+        "discontinuities": None,
+        # Parameter values evaluated per second of run time, rows in
+        # between are interpolated
+        "steps_per_second": 60,
+        "rate_func": linear,
+        "suspend_mobject_updating": False,
+    }
+
+    def __init__(
+        self,
+        graph: ParametricCurve,
+        axes: Axes,
+        function: Callable,
+        params: dict[str, tuple[float, float]],
+        **kwargs
+    ):
+        self.axes = axes
+        self.function = function
+        self.params = params
+        super().__init__(graph, **kwargs)
+        if self.discontinuities is None:
+            self.discontinuities = graph.discontinuities
+        self.epsilon = graph.epsilon
+
+    def get_t_range(self) -> np.ndarray:
+        if self.x_range is None:
+            return np.array(self.mobject.t_range, dtype=float)
+        t_range = np.array(self.axes.x_range, dtype=float)
+        t_range[:len(self.x_range)] = self.x_range
+        if len(self.x_range) < 3:
+            t_range[2] /= self.axes.num_sampled_graph_points_per_tick
+        return t_range
+
+    def get_param_values(self, alphas: np.ndarray) -> list[np.ndarray]:
+        return [
+            interpolate(start, end, alphas)
+            for start, end in self.params.values()
+        ]
+
+    def evaluate(self, xs: np.ndarray, param_values: list[np.ndarray]) -> np.ndarray:
+        x_grid = xs[np.newaxis, :]
+        param_grids = [values[:, np.newaxis] for values in param_values]
+        shape = (len(param_values[0]) if param_values else 1, len(xs))
+        try:
+            result = np.asarray(self.function(x_grid, *param_grids), dtype=float)
+            if result.shape == shape:
+                return result
+        except Exception:
+            pass
+        # Functions which don't take arrays are evaluated point by point
+        return np.broadcast_to(
+            np.vectorize(self.function, otypes=[float])(x_grid, *param_grids),
+            shape,
+        )
+
+    def begin(self) -> None:
+        self.sample_paths = get_sample_paths(
+            self.get_t_range(), self.discontinuities, self.epsilon
+        )
+        xs = np.hstack(self.sample_paths)
+        self.path_ends = np.cumsum([len(path) for path in self.sample_paths])[:-1]
+
+        num_steps = max(int(np.ceil(self.run_time * self.steps_per_second)), 1)
+        self.alphas = np.linspace(0, 1, num_steps + 1)
+        with np.errstate(all="ignore"):
+            self.y_grid = self.evaluate(xs, self.get_param_values(self.alphas))
+
+        # Linear axes, so c2p is affine
+        origin = self.axes.c2p(0, 0)
+        x_unit = self.axes.c2p(1, 0) - origin
+        y_unit = self.axes.c2p(0, 1) - origin
+        self.base_points = origin + np.outer(xs, x_unit)
+        self.y_unit = y_unit
+        super().begin()
+
+    def get_anchors(self, alpha: float) -> np.ndarray:
+        index = alpha * (len(self.alphas) - 1)
+        low = min(int(index), len(self.alphas) - 2)
+        ys = interpolate(self.y_grid[low], self.y_grid[low + 1], index - low)
+        return self.base_points + np.outer(ys, self.y_unit)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        anchors = self.get_anchors(alpha)
+        self.mobject.set_points(np.vstack([
+            get_corner_points(path)
+            for path in np.split(anchors, self.path_ends)
+        ]))
+        if getattr(self.mobject, "use_smoothing", False):
+            self.mobject.make_approximately_smooth()
+
+    def finish(self) -> None:
+        super().finish()
+        end_values = [end for _, end in self.params.values()]
+        self.mobject.underlying_function = lambda x: self.function(x, *end_values)
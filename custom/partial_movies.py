@@ -0,0 +1,166 @@
+import hashlib
+import os
+import shutil
+import types
+
+from manimlib import *
+from manimlib.config import get_custom_config
+from manimlib.utils.directories import get_temp_dir
+
+from custom.disk_cache import DiskCache
+from custom.graph import PLAIN_TYPES
+from custom.graph import get_code_key
+from custom.graph import get_code_names
+
+
+# Partial movie files (break_into_partial_movies) kept under
+# temp/partial_movie_cache, keyed on everything a play or wait renders
+# from: the scene's mobjects at its start, the animations with their
+# mobjects, targets, rate functions and settings, and the resolution,
+# frame rate and background. SceneX runs a play whose file is in the
+# cache with skip_animations, which only brings the mobjects to their
+# final state, and copies the file in.
+#
+# Mobjects are hashed by their data, uniforms, plain attributes,
+# submobjects and updaters, functions by their bytecode and what they
+# read. A play can't be cached when something it depends on can't be
+# hashed, like a function reading the scene, or when mobjects have
+# time-based updaters, which get one large dt when skipping.
+def get_partial_movie_cache_config() -> dict:
+    return {
+        "enabled": True,
+        "max_size_mb": 1024,
+        **(get_custom_config().get("partial_movie_cache") or {}),
+    }
+
+
+class Unhashable(Exception):
+    pass
+
+
+# Modules whose functions are hashed by name rather than by bytecode
+LIBRARY_MODULES = ("manimlib", "numpy", "math", "builtins", "random")
+
+
+class ContentHasher:
+    def __init__(self):
+        self.digest = hashlib.sha256()
+        self.seen = {}
+
+    def update(self, value) -> None:
+        digest = self.digest
+        if isinstance(value, (*PLAIN_TYPES, np.generic)):
+            digest.update(f"{type(value).__name__}:{value!r};".encode())
+            return
+        if isinstance(value, np.ndarray):
+            digest.update(f"array:{value.dtype}:{value.shape};".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+            return
+        if id(value) in self.seen:
+            digest.update(f"ref:{self.seen[id(value)]};".encode())
+            return
+        self.seen[id(value)] = len(self.seen)
+
+        if isinstance(value, Mobject):
+            self.update_mobject(value)
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"{type(value).__name__}:{len(value)};".encode())
+            for item in value:
+                self.update(item)
+        elif isinstance(value, dict):
+            digest.update(f"dict:{len(value)};".encode())
+            for key, item in value.items():
+                self.update(key)
+                self.update(item)
+        elif isinstance(value, types.FunctionType):
+            self.update_function(value)
+        elif isinstance(value, types.MethodType):
+            self.update(value.__func__)
+            self.update(value.__self__)
+        elif isinstance(value, (type, types.ModuleType, types.BuiltinFunctionType, np.ufunc)):
+            digest.update(f"name:{getattr(value, '__module__', '')}.{value.__name__};".encode())
+        elif isinstance(value, (Scene, Camera)):
+            raise Unhashable(type(value).__name__)
+        elif hasattr(value, "__dict__"):
+            digest.update(f"object:{type(value).__qualname__};".encode())
+            self.update(vars(value))
+        else:
+            raise Unhashable(type(value).__name__)
+
+    def update_function(self, function: types.FunctionType) -> None:
+        module = (function.__module__ or "").split(".")[0]
+        if module in LIBRARY_MODULES:
+            self.digest.update(f"name:{function.__module__}.{function.__qualname__};".encode())
+            return
+        code = function.__code__
+        self.digest.update(repr(get_code_key(code)).encode())
+        try:
+            self.update([cell.cell_contents for cell in function.__closure__ or ()])
+        except ValueError:
+            raise Unhashable("empty closure cell")
+        self.update(function.__defaults__ or ())
+        for name in sorted(get_code_names(code)):
+            if name in function.__globals__:
+                self.update(name)
+                self.update(function.__globals__[name])
+
+    def update_mobject(self, mobject: Mobject) -> None:
+        if mobject.time_based_updaters:
+            raise Unhashable("time-based updater")
+        self.digest.update(f"mobject:{type(mobject).__qualname__};".encode())
+        self.update(mobject.data)
+        self.update(mobject.uniforms)
+        # data_version (custom.updaters) counts changes, it isn't content
+        self.update({
+            key: value
+            for key, value in mobject.__dict__.items()
+            if isinstance(value, PLAIN_TYPES) and key != "data_version"
+        })
+        self.update(mobject.non_time_updaters)
+        self.update(mobject.submobjects)
+        for key in ("target", "saved_state"):
+            self.update(getattr(mobject, key, None))
+
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()[:32]
+
+
+# Files are evicted least recently used first past max_size_mb, see
+# DiskCache
+class PartialMovieCache(DiskCache):
+    def __init__(self, directory: str, max_size: int):
+        super().__init__(directory, max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def get_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, key + extension)
+
+    def get(self, key: str, extension: str) -> str | None:
+        path = self.get_path(key, extension)
+        if os.path.exists(path):
+            self.touch(path)
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    def put(self, key: str, movie_path: str) -> None:
+        path = self.get_path(key, os.path.splitext(movie_path)[1])
+        old_size = self.get_entry_size(path) if os.path.exists(path) else 0
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(movie_path, temp_path)
+        os.replace(temp_path, path)
+        self.add_entry(path, old_size)
+
+
+_partial_movie_cache_config = get_partial_movie_cache_config()
+
+# Left as None when disabled, so nothing under temporary_storage is touched
+PARTIAL_MOVIE_CACHE = None
+
+if _partial_movie_cache_config["enabled"]:
+    PARTIAL_MOVIE_CACHE = PartialMovieCache(
+        os.path.join(get_temp_dir(), "partial_movie_cache"),
+        max_size=int(_partial_movie_cache_config["max_size_mb"] * 1024 * 1024),
+    )
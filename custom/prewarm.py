@@ -0,0 +1,203 @@
+import argparse
+import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from manimlib import *
+from manimlib.logger import log
+
+from custom.subtitle import Subtitle
+from custom.tex_cache import TEX_CACHE
+from custom.tex_file_writing import compile_tex_batch
+from custom.tex_file_writing import get_tex_file_bodies
+
+
+TEX_CLASSES = {
+    "SingleStringTex": SingleStringTex,
+    "Tex": Tex,
+    "TexText": TexText,
+    "Subtitle": Subtitle,
+}
+
+# Keyword arguments which change what gets compiled; the others (color,
+# font_size, ...) are applied after compiling and can be ignored
+TEX_KWARGS = ["tex_to_color_map", "isolate", "alignment", "math_mode", "arg_separator"]
+
+
+class Unresolved(Exception):
+    pass
+
+
+# Evaluates literals, and names bound to literals, without running the file
+class LiteralResolver:
+    def __init__(self, assignments: dict[str, list[ast.expr]]):
+        self.assignments = assignments
+
+    def resolve(self, node: ast.expr):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            values = self.assignments.get(node.id, [])
+            if len(values) != 1:
+                raise Unresolved(node.id)
+            return self.resolve(values[0])
+        if isinstance(node, (ast.List, ast.Tuple)):
+            result = []
+            for elt in node.elts:
+                if isinstance(elt, ast.Starred):
+                    result.extend(self.resolve(elt.value))
+                else:
+                    result.append(self.resolve(elt))
+            return result
+        if isinstance(node, ast.Dict):
+            result = {}
+            for key, value in zip(node.keys, node.values):
+                if key is None:
+                    result.update(self.resolve(value))
+                else:
+                    # Only the keys matter for compiling, not the colors
+                    result[self.resolve(key)] = None
+            return result
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "ColorMap"
+            and len(node.args) == 1
+        ):
+            return self.resolve(node.args[0])
+        raise Unresolved(ast.dump(node))
+
+
+def get_scanned_nodes(tree: ast.Module, scene_name: str | None) -> list[ast.AST]:
+    classes = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    }
+    if scene_name is not None and scene_name not in classes:
+        raise ValueError(f"No class {scene_name} in the file")
+
+    # Module level code, plus the scene and any base classes of it in this file
+    nodes = [node for node in tree.body if not isinstance(node, ast.ClassDef)]
+    to_visit = [scene_name] if scene_name else list(classes)
+    visited = set()
+    while to_visit:
+        name = to_visit.pop()
+        if name in visited or name not in classes:
+            continue
+        visited.add(name)
+        nodes.append(classes[name])
+        to_visit.extend(base.id for base in classes[name].bases if isinstance(base, ast.Name))
+    return nodes
+
+
+def get_assignments(nodes: list[ast.AST]) -> dict[str, list[ast.expr]]:
+    assignments = {}
+    for root in nodes:
+        for node in ast.walk(root):
+            if isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        assignments.setdefault(target.id, []).append(node.value)
+    return assignments
+
+
+# Returns the (class name, tex strings, kwargs) of every tex construction
+# which can be resolved statically, and the line and source of the rest
+def scan_tex_strings(file_name: str, scene_name: str | None = None):
+    with open(file_name, "r", encoding="utf-8") as file:
+        source = file.read()
+    tree = ast.parse(source, filename=file_name)
+    nodes = get_scanned_nodes(tree, scene_name)
+    resolver = LiteralResolver(get_assignments(nodes))
+
+    found = []
+    unresolved = []
+    for root in nodes:
+        for node in ast.walk(root):
+            if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+                continue
+            if node.func.id not in TEX_CLASSES:
+                continue
+            try:
+                if any(isinstance(arg, ast.Starred) for arg in node.args):
+                    raise Unresolved("*args")
+                tex_strings = tuple(resolver.resolve(arg) for arg in node.args)
+                if not all(isinstance(s, str) for s in tex_strings) or not tex_strings:
+                    raise Unresolved("tex strings")
+                kwargs = {}
+                for keyword in node.keywords:
+                    if keyword.arg is None:
+                        raise Unresolved("**kwargs")
+                    if keyword.arg in TEX_KWARGS:
+                        kwargs[keyword.arg] = resolver.resolve(keyword.value)
+            except Unresolved:
+                unresolved.append((node.lineno, ast.get_source_segment(source, node)))
+                continue
+            spec = (node.func.id, tex_strings, kwargs)
+            if spec not in found:
+                found.append(spec)
+    return found, unresolved
+
+
+def get_tex_kwargs(kwargs: dict) -> dict:
+    kwargs = dict(kwargs)
+    if "tex_to_color_map" in kwargs:
+        kwargs["tex_to_color_map"] = dict.fromkeys(kwargs["tex_to_color_map"], WHITE)
+    return kwargs
+
+
+def get_spec_bodies(spec) -> list[str]:
+    class_name, tex_strings, kwargs = spec
+    return get_tex_file_bodies(TEX_CLASSES[class_name], *tex_strings, **get_tex_kwargs(kwargs))
+
+
+# Constructing parses the compiled svgs into the tex cache,
+# returns the number of new cache entries
+def build_spec(spec) -> int:
+    class_name, tex_strings, kwargs = spec
+    misses = TEX_CACHE.misses
+    TEX_CLASSES[class_name](*tex_strings, **get_tex_kwargs(kwargs))
+    return TEX_CACHE.misses - misses
+
+
+def prewarm(file_name: str, scene_name: str | None = None, jobs: int | None = None) -> None:
+    jobs = jobs or os.cpu_count() or 1
+    specs, unresolved = scan_tex_strings(file_name, scene_name)
+
+    bodies = []
+    for spec in specs:
+        for body in get_spec_bodies(spec):
+            if body not in bodies:
+                bodies.append(body)
+    chunks = [bodies[i::jobs] for i in range(jobs) if bodies[i::jobs]]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        compiled = sum(map(len, executor.map(compile_tex_batch, chunks)))
+        # Parsing is only kept when there is a tex cache to keep it in
+        if TEX_CACHE is not None:
+            parsed = sum(executor.map(build_spec, specs, chunksize=max(1, len(specs) // (4 * jobs))))
+
+    log.info(
+        "Prewarmed %d tex constructions (%d tex files, %d newly compiled) with %d workers",
+        len(specs), len(bodies), compiled, jobs
+    )
+    if TEX_CACHE is not None:
+        log.info("Parsed %d new entries into the tex cache", parsed)
+    for lineno, segment in unresolved:
+        log.warning("Could not resolve statically, line %d: %s", lineno, segment)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile the tex strings of a scene file into the tex cache before rendering"
+    )
+    parser.add_argument("file", help="Path to the scene file")
+    parser.add_argument("scene_name", nargs="?", help="Only scan this scene class")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes")
+    args = parser.parse_args()
+    prewarm(args.file, args.scene_name, args.jobs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import json
+import os
+import sys
+import threading
+import time
+
+from manimlib import *
+
+
+# Wall time of updaters, animation interpolation, rendering and encoding,
+# aggregated by category and source location. SceneX turns it on with
+# profile=True or MANIM_PROFILE=1 in the environment, and at the end of
+# the scene logs the table and writes the raw events as a Chrome trace
+# (open it in chrome://tracing or https://ui.perfetto.dev).
+class Profiler:
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.totals = {}
+        self.events = []
+        self.locations = {}
+
+    def record(self, category: str, name: str, start: float) -> None:
+        end = time.perf_counter()
+        duration = end - start
+        total = self.totals.setdefault((category, name), [0, 0.0, 0.0])
+        total[0] += 1
+        total[1] += duration
+        total[2] = max(total[2], duration)
+        self.events.append((category, name, start, duration, threading.get_ident()))
+
+    # Where a callable was defined, following source_function from the
+    # wrappers in custom.updaters to the function they were made for
+    def get_location(self, obj) -> str:
+        key = id(obj)
+        if key not in self.locations:
+            target = obj
+            while hasattr(target, "source_function"):
+                target = target.source_function
+            func = getattr(target, "__func__", target)
+            code = getattr(func, "__code__", None)
+            if code is None:
+                location = repr(target)
+            else:
+                location = "{}:{} {}".format(
+                    os.path.relpath(code.co_filename), code.co_firstlineno,
+                    getattr(func, "__qualname__", func.__name__),
+                )
+            self.locations[key] = location
+        return self.locations[key]
+
+    def get_table(self) -> str:
+        rows = sorted(self.totals.items(), key=lambda item: -item[1][1])
+        wall_time = time.perf_counter() - self.start_time
+        lines = [
+            f"{'category':<10}{'calls':>9}{'total (s)':>12}{'mean (ms)':>12}{'max (ms)':>11}{'share':>8}  location",
+        ]
+        for (category, name), (count, total, longest) in rows:
+            lines.append(
+                f"{category:<10}{count:>9}{total:>12.3f}{1000 * total / count:>12.3f}"
+                f"{1000 * longest:>11.3f}{total / wall_time:>8.1%}  {name}"
+            )
+        return "\n".join(lines)
+
+    def write_trace(self, path: str) -> None:
+        trace_events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": 1e6 * (start - self.start_time),
+                "dur": 1e6 * duration,
+                "pid": os.getpid(),
+                "tid": tid,
+            }
+            for category, name, start, duration, tid in self.events
+        ]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events}, file)
+
+
+PROFILER = None
+
+_update = Mobject.update
+
+
+# Mobject.update, timing each updater
+def profiled_update(self, dt: float = 0, recurse: bool = True):
+    if not self.has_updaters or self.updating_suspended:
+        return self
+    for updater in self.time_based_updaters:
+        start = time.perf_counter()
+        updater(self, dt)
+        PROFILER.record("updater", PROFILER.get_location(updater), start)
+    for updater in self.non_time_updaters:
+        start = time.perf_counter()
+        updater(self)
+        PROFILER.record("updater", PROFILER.get_location(updater), start)
+    if recurse:
+        for submob in self.submobjects:
+            submob.update(dt, recurse)
+    return self
+
+
+# func, recorded while profiling is on. PROFILER is read once, as the
+# encoder thread may call it while profiling stops
+def timed(category: str, name: str, func):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        profiler = PROFILER
+        if profiler is not None:
+            profiler.record(category, name, start)
+        return result
+    return wrapper
+
+
+# First frame outside manimlib and custom/, i.e. the script line
+def get_caller_location() -> str:
+    custom_dir = os.path.dirname(os.path.abspath(__file__))
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not filename.startswith(custom_dir) and "manimlib" not in filename:
+            return f"{os.path.relpath(filename)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+def start_profiling() -> Profiler:
+    global PROFILER
+    PROFILER = Profiler()
+    Mobject.update = profiled_update
+    return PROFILER
+
+
+def stop_profiling() -> None:
+    global PROFILER
+    Mobject.update = _update
+    PROFILER = None
@@ -0,0 +1,137 @@
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from manimlib.logger import log
+
+
+# Renders each section of a scene marked with SceneX.run_sections in its
+# own manimgl process, then joins the clips without re-encoding:
+#
+#     python -m custom.render_sections 2022/lines_slope_theory.py Main -j 4 -- --uhd
+#
+# Arguments after -- are passed on to manimgl. One process first runs the
+# scene without rendering to write the section checkpoints which are
+# missing (custom.checkpoint), so each worker starts from its checkpoint
+# instead of replaying the sections before it. A worker which had to
+# replay them anyway is logged as an error.
+
+
+# Number of arguments of the self.run_sections(...) call in the scene's
+# construct, found without running the file
+def count_sections(file_name: str, scene_name: str) -> int:
+    with open(file_name, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=file_name)
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or node.name != scene_name:
+            continue
+        for child in ast.walk(node):
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Attribute)
+                and child.func.attr == "run_sections"
+            ):
+                return len(child.args)
+    raise ValueError(f"No self.run_sections(...) call in {scene_name}")
+
+
+def write_checkpoints(file_name: str, scene_name: str, manimgl_args: list[str]) -> None:
+    env = dict(os.environ, MANIM_CHECKPOINTS_ONLY="1")
+    command = [sys.executable, "-m", "manimlib", file_name, scene_name, "-w", *manimgl_args]
+    subprocess.run(command, env=env, check=True)
+
+
+# Path of the section's clip and the section the worker started from
+def render_section(
+    file_name: str,
+    scene_name: str,
+    index: int,
+    manimgl_args: list[str],
+    report_dir: str,
+) -> tuple[str, int]:
+    report_path = os.path.join(report_dir, f"section_{index}.txt")
+    env = dict(os.environ, MANIM_SECTION=str(index), MANIM_SECTION_REPORT=report_path)
+    command = [
+        sys.executable, "-m", "manimlib", file_name, scene_name, "-w",
+        "--file_name", f"{scene_name}_section_{index}",
+        *manimgl_args,
+    ]
+    subprocess.run(command, env=env, check=True)
+    with open(report_path, "r", encoding="utf-8") as file:
+        clip_path, first_section = file.read().split("\n")[:2]
+    return clip_path, int(first_section)
+
+
+def concat_clips(clip_paths: list[str], output_path: str) -> None:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        for path in clip_paths:
+            file.write("file '{}'\n".format(os.path.abspath(path).replace("'", r"'\''")))
+        list_path = file.name
+    try:
+        subprocess.run([
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", list_path,
+            "-c", "copy", output_path,
+        ], check=True)
+    finally:
+        os.remove(list_path)
+
+
+def render_sections(
+    file_name: str,
+    scene_name: str,
+    jobs: int | None = None,
+    manimgl_args: list[str] | None = None,
+    output_path: str | None = None,
+) -> str:
+    manimgl_args = manimgl_args or []
+    num_sections = count_sections(file_name, scene_name)
+    jobs = jobs or os.cpu_count() or 1
+    log.info("Writing the section checkpoints of %s", scene_name)
+    write_checkpoints(file_name, scene_name, manimgl_args)
+    log.info("Rendering %d sections of %s with %d workers", num_sections, scene_name, jobs)
+
+    with tempfile.TemporaryDirectory() as report_dir:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                lambda index: render_section(file_name, scene_name, index, manimgl_args, report_dir),
+                range(num_sections),
+            ))
+    clip_paths = [clip_path for clip_path, _ in results]
+    for index, (_, first_section) in enumerate(results):
+        if first_section != index:
+            log.error(
+                "Section %d replayed sections %d to %d instead of starting from its checkpoint",
+                index, first_section, index - 1
+            )
+
+    if output_path is None:
+        extension = os.path.splitext(clip_paths[0])[1]
+        output_path = os.path.join(os.path.dirname(clip_paths[0]), scene_name + extension)
+    concat_clips(clip_paths, output_path)
+    log.info("Concatenated %d section clips into %s", num_sections, output_path)
+    return output_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Render the sections of a scene in parallel processes and concatenate them"
+    )
+    parser.add_argument("file", help="Path to the scene file")
+    parser.add_argument("scene_name", help="Scene class whose construct calls self.run_sections")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes")
+    parser.add_argument("-o", "--output", help="Path of the concatenated video")
+    parser.add_argument("manimgl_args", nargs=argparse.REMAINDER, help="Arguments for manimgl, after --")
+    args = parser.parse_args()
+    manimgl_args = args.manimgl_args
+    if manimgl_args[:1] == ["--"]:
+        manimgl_args = manimgl_args[1:]
+    render_sections(args.file, args.scene_name, args.jobs, manimgl_args, args.output)
+
+
+if __name__ == "__main__":
+    main()
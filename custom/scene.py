@@ -0,0 +1,405 @@
+import os
+import shutil
+import time
+from typing import Callable
+
+from manimlib import *
+from manimlib.animation.animation import prepare_animation
+from manimlib.logger import log
+from manimlib.scene.scene import EndScene
+from manimlib.scene.scene import handle_play_like_call
+from manimlib.utils.family_ops import extract_mobject_family_members
+from manimlib.utils.directories import get_output_dir
+
+from custom import profiler
+from custom.checkpoint import find_latest_checkpoint
+from custom.checkpoint import get_checkpoint_config
+from custom.checkpoint import read_checkpoint
+from custom.checkpoint import set_scene_state
+from custom.checkpoint import write_checkpoint
+from custom.file_writer import SceneFileWriterX
+from custom.graph import set_camera_resolution
+from custom.partial_movies import PARTIAL_MOVIE_CACHE
+from custom.partial_movies import ContentHasher
+from custom.partial_movies import Unhashable
+from custom.updaters import UPDATER_STATS
+
+
+# Scene (Scene Extended) with a faster way through sub-frame plays.
+#
+# A play shorter than one frame, like self.play(..., run_time=0.001) in a
+# loop, still renders and writes a whole frame of its starting state. With
+# coalesce_subframe_plays, such plays only begin and finish their
+# animations and add up their run time; a frame is rendered each time the
+# total crosses a frame boundary, showing the state at that point. The
+# final state is the same, and the video gets the actual duration of the
+# plays instead of one frame for each.
+#
+# With profile (or MANIM_PROFILE=1 in the environment), the wall time of
+# every updater, animation interpolate, render and encode is recorded by
+# custom.profiler; the table is logged at the end and the raw trace is
+# written to <output dir>/<Scene>_profile.json. "output" is the scene's
+# side of writing a frame (readback, and with the encoder thread only
+# handing the frame over), "encode" the encoder thread's pipe writes.
+#
+# construct can mark its sections with self.run_sections(self.start, ...).
+# With MANIM_SECTION=<index> in the environment (set by
+# custom.render_sections), only that section is rendered and the scene
+# ends after it. The section starts from its checkpoint (custom.checkpoint)
+# when there is a valid one, else everything before it runs with
+# skip_animations, which builds its starting state without rendering or
+# encoding. With MANIM_CHECKPOINTS_ONLY=1, nothing is rendered or written:
+# the sections run with skip_animations from the last valid checkpoint
+# on, writing the checkpoints of the ones after it. With
+# resume_from_checkpoint (or MANIM_RESUME=1), the scene starts from the
+# last section with a valid checkpoint, and the movie is written as
+# <Scene>_resumed. In all cases code in construct before run_sections
+# isn't rendered.
+#
+# With break_into_partial_movies, the partial file of each play and wait
+# is cached by a hash of what it renders from (custom.partial_movies), and
+# a later render of the same play reuses the file instead of rendering.
+#
+# With static_hold_waits, a wait during which nothing can change (no
+# updaters other than those from custom.updaters which skip on unchanged
+# inputs) renders and reads back one frame, and writes its bytes again
+# for the rest of the hold; a frame is rendered again whenever an
+# updater does run. A frame held long enough isn't piped again for each
+# of its frames: SceneFileWriterX encodes it once as a segment of the
+# movie which repeats it.
+#
+# Frames are written through SceneFileWriterX (custom.file_writer), which
+# encodes on its own thread.
+class SceneX(Scene):
+    CONFIG = {
+        "coalesce_subframe_plays": True,
+        "static_hold_waits": True,
+        "profile": False,
+        "resume_from_checkpoint": False,
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        section = os.environ.get("MANIM_SECTION")
+        self.section_index = None if section is None else int(section)
+        self.checkpoints_only = bool(os.environ.get("MANIM_CHECKPOINTS_ONLY"))
+        self.resume_from_checkpoint |= bool(os.environ.get("MANIM_RESUME"))
+        self.first_section = None
+
+        file_writer_config = dict(self.file_writer_config)
+        if self.checkpoints_only:
+            file_writer_config.update(write_to_movie=False, save_last_frame=False)
+        elif self.resume_from_checkpoint and not file_writer_config.get("file_name"):
+            # Not over the movie of the whole scene
+            file_writer_config["file_name"] = f"{self}_resumed"
+        self.file_writer = SceneFileWriterX(self, **file_writer_config)
+        set_camera_resolution(self.camera.pixel_width, self.camera.pixel_height)
+        self.subframe_time = 0
+        self.num_coalesced_plays = 0
+        self.num_coalesced_frames = 0
+        self.num_held_frames = 0
+        if self.profile or os.environ.get("MANIM_PROFILE"):
+            self.start_profiling()
+
+        self.section_skip_animations = self.skip_animations
+        if self.section_index or self.resume_from_checkpoint or self.checkpoints_only:
+            self.skip_animations = True
+
+    def run_sections(self, *sections: Callable[[], None]) -> None:
+        sections = list(sections)
+        # What construct sets from here on goes into checkpoints
+        base_attrs = set(self.__dict__)
+        use_checkpoints = get_checkpoint_config()["enabled"]
+
+        first = 0
+        if use_checkpoints and self.section_index is not None:
+            first = self.restore_checkpoint(sections, self.section_index)
+        elif use_checkpoints and (self.resume_from_checkpoint or self.checkpoints_only):
+            latest = find_latest_checkpoint(self, sections)
+            if latest is not None:
+                first = self.restore_checkpoint(sections, latest)
+        if self.resume_from_checkpoint and not self.checkpoints_only:
+            self.skip_animations = self.section_skip_animations
+        self.first_section = first
+        last = len(sections) - 1 if self.section_index is None else self.section_index
+
+        for index in range(first, last + 1):
+            self.flush_subframe_time()
+            if use_checkpoints:
+                write_checkpoint(self, base_attrs, sections, index)
+            if self.checkpoints_only and index == last:
+                break
+            if index == self.section_index:
+                self.skip_animations = self.section_skip_animations
+            sections[index]()
+        if self.section_index is not None or self.checkpoints_only:
+            self.flush_subframe_time()
+            raise EndScene()
+
+    # Returns the index of the section to start from
+    def restore_checkpoint(self, sections: list, index: int) -> int:
+        state = read_checkpoint(self, sections, index)
+        if state is None:
+            return 0
+        set_scene_state(self, state)
+        self.refresh_static_mobjects()
+        log.info("Starting from the checkpoint of section %s", sections[index].__name__)
+        return index
+
+    def start_profiling(self) -> None:
+        self.profiler = profiler.start_profiling()
+        self.play_location = "?"
+        # Replaced with timed wrappers, and put back by stop_profiling
+        self.profiled_methods = [
+            (self.camera, "capture", "render", "camera.capture"),
+            (self.file_writer, "write_frame", "output", "file_writer.write_frame"),
+            (self, "write_frame_data", "output", "SceneX.write_frame_data"),
+            (self, "write_held_frames", "output", "SceneX.write_held_frames"),
+        ]
+        for obj, attr, category, name in self.profiled_methods:
+            setattr(obj, attr, profiler.timed(category, name, getattr(obj, attr)))
+
+    def stop_profiling(self) -> None:
+        log.info("Profile of %s:\n%s", type(self).__name__, self.profiler.get_table())
+        path = os.path.join(get_output_dir(), f"{type(self).__name__}_profile.json")
+        self.profiler.write_trace(path)
+        log.info("Profile trace written to %s", path)
+        for obj, attr, _, _ in self.profiled_methods:
+            delattr(obj, attr)
+        profiler.stop_profiling()
+        self.profiler = None
+
+    def is_profiling(self) -> bool:
+        return getattr(self, "profiler", None) is not None
+
+    # Scene.progress_through_animations, timing each animation's
+    # interpolate under the line of the play it came from
+    def progress_through_animations(self, animations) -> None:
+        if not self.is_profiling():
+            super().progress_through_animations(animations)
+            return
+        names = [
+            f"{type(animation).__name__} {self.play_location}"
+            for animation in animations
+        ]
+        last_t = 0
+        for t in self.get_animation_time_progression(animations):
+            dt = t - last_t
+            last_t = t
+            for animation, name in zip(animations, names):
+                animation.update_mobjects(dt)
+                alpha = t / animation.run_time
+                start = time.perf_counter()
+                animation.interpolate(alpha)
+                self.profiler.record("animation", name, start)
+            self.update_frame(dt)
+            self.emit_frame()
+
+    def get_frame_duration(self) -> float:
+        return 1 / self.camera.frame_rate
+
+    def play(self, *proto_animations, **animation_config) -> None:
+        if self.is_profiling():
+            self.play_location = profiler.get_caller_location()
+        inside_embed = getattr(self, "inside_embed", False)
+        if not self.coalesce_subframe_plays or inside_embed or len(proto_animations) == 0:
+            self.flush_subframe_time()
+            super().play(*proto_animations, **animation_config)
+            return
+
+        animations = list(map(prepare_animation, proto_animations))
+        for anim in animations:
+            anim.update_rate_info(**animation_config)
+        run_time = self.get_run_time(animations)
+        if run_time >= self.get_frame_duration():
+            self.flush_subframe_time()
+            self.run_with_partial_movie_cache(
+                "play", super().play, animations, animation_config
+            )
+            return
+
+        self.update_skipping_status()
+        self.begin_animations(animations)
+        self.finish_animations(animations)
+        self.num_coalesced_plays += 1
+
+        self.subframe_time += run_time
+        num_frames = int(self.subframe_time / self.get_frame_duration())
+        if num_frames > 0:
+            self.subframe_time -= num_frames * self.get_frame_duration()
+            self.emit_coalesced_frames(num_frames)
+        # After the frames, which go to this play's partial movie index
+        self.num_plays += 1
+
+    def emit_coalesced_frames(self, num_frames: int) -> None:
+        should_write = not self.skip_animations
+        if should_write:
+            self.file_writer.begin_animation()
+        if self.window:
+            self.real_animation_start_time = time.time()
+            self.virtual_animation_start_time = self.time
+        self.refresh_static_mobjects()
+        for _ in range(num_frames):
+            self.update_frame(self.get_frame_duration())
+            self.emit_frame()
+        if should_write:
+            self.file_writer.end_animation()
+        self.num_coalesced_frames += num_frames
+
+    # The time left over from sub-frame plays, less than one frame, is
+    # added without a frame of its own before anything else runs
+    def flush_subframe_time(self) -> None:
+        if self.subframe_time > 0:
+            self.increment_time(self.subframe_time)
+            self.update_mobjects(self.subframe_time)
+            self.subframe_time = 0
+
+    def wait(
+        self,
+        duration: float = DEFAULT_WAIT_TIME,
+        stop_condition: Callable[[], bool] | None = None,
+        note: str | None = None,
+        ignore_presenter_mode: bool = False
+    ):
+        self.flush_subframe_time()
+        args = (duration, stop_condition, note, ignore_presenter_mode)
+        method = super().wait
+        if self.can_hold_static_frame(stop_condition, ignore_presenter_mode):
+            method = self.hold_static_frame
+        return self.run_with_partial_movie_cache("wait", method, args, {})
+
+    def can_hold_static_frame(self, stop_condition, ignore_presenter_mode: bool) -> bool:
+        if not self.static_hold_waits or stop_condition is not None:
+            return False
+        if self.skip_animations or self.window or getattr(self, "inside_embed", False):
+            return False
+        if self.presenter_mode and not ignore_presenter_mode:
+            return False
+        return all(
+            not mob.time_based_updaters and all(
+                getattr(updater, "skips_unchanged", False)
+                for updater in mob.non_time_updaters
+            )
+            for mob in extract_mobject_family_members(self.mobjects)
+        )
+
+    # Scene.wait, rendering a frame only when an updater has run. The
+    # frames in between repeat the last one, and are written together
+    # once it changes or the wait ends. When skipping (e.g. a wait taken
+    # from the partial movie cache) there is no pipe to write to, so only
+    # time and updaters advance
+    @handle_play_like_call
+    def hold_static_frame(self, duration: float, *_) -> None:
+        self.update_mobjects(dt=0)
+        frame_data = None
+        num_held = 0
+        last_t = 0
+        for t in self.get_wait_time_progression(duration):
+            dt = t - last_t
+            last_t = t
+            executed = UPDATER_STATS["executed"]
+            self.increment_time(dt)
+            self.update_mobjects(dt)
+            if self.skip_animations:
+                continue
+            if frame_data is None or UPDATER_STATS["executed"] != executed:
+                self.write_held_frames(frame_data, num_held)
+                num_held = 0
+                self.camera.clear()
+                self.camera.capture(*self.mobjects)
+                frame_data = self.camera.get_raw_fbo_data()
+                self.write_frame_data(frame_data)
+            else:
+                num_held += 1
+        self.write_held_frames(frame_data, num_held)
+        self.refresh_static_mobjects()
+
+    def write_frame_data(self, frame_data: bytes) -> None:
+        self.file_writer.write_frame_data(frame_data)
+
+    def write_held_frames(self, frame_data: bytes | None, num_frames: int) -> None:
+        if num_frames == 0:
+            return
+        self.num_held_frames += num_frames
+        self.file_writer.write_still_frames(frame_data, num_frames)
+
+    def can_reuse_partial_movies(self) -> bool:
+        return (
+            PARTIAL_MOVIE_CACHE is not None
+            and self.file_writer.write_to_movie
+            and self.file_writer.break_into_partial_movies
+            and not self.skip_animations
+            and self.start_at_animation_number is None
+            and self.end_at_animation_number is None
+            and not self.window
+            and not self.presenter_mode
+            and not getattr(self, "inside_embed", False)
+        )
+
+    def get_partial_movie_key(self, kind: str, args, kwargs) -> str | None:
+        hasher = ContentHasher()
+        try:
+            hasher.update([
+                kind, args, kwargs, self.mobjects,
+                self.camera.pixel_width, self.camera.pixel_height,
+                self.camera.frame_rate, self.camera.background_rgba,
+                self.file_writer.movie_file_extension,
+            ])
+        except (Unhashable, RecursionError):
+            return None
+        return hasher.hexdigest()
+
+    # Calls method (Scene.play or Scene.wait), taking its partial movie
+    # file from the cache when it has been rendered before
+    def run_with_partial_movie_cache(self, kind: str, method: Callable, args, kwargs):
+        key = None
+        if self.can_reuse_partial_movies():
+            key = self.get_partial_movie_key(kind, args, kwargs)
+        if key is None:
+            return method(*args, **kwargs)
+
+        path = self.file_writer.get_next_partial_movie_path()
+        cached_path = PARTIAL_MOVIE_CACHE.get(key, self.file_writer.movie_file_extension)
+        if cached_path is None:
+            result = method(*args, **kwargs)
+            if os.path.exists(path):
+                PARTIAL_MOVIE_CACHE.put(key, path)
+            return result
+
+        self.skip_animations = True
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            self.skip_animations = False
+        shutil.copyfile(cached_path, path)
+        return result
+
+    def tear_down(self) -> None:
+        self.flush_subframe_time()
+        if self.num_coalesced_plays > 0:
+            log.info(
+                "Coalesced %d sub-frame plays into %d frames",
+                self.num_coalesced_plays, self.num_coalesced_frames
+            )
+        if self.num_held_frames > 0:
+            log.info("Held %d frames of waits without rendering them", self.num_held_frames)
+        if UPDATER_STATS["skipped"] > 0:
+            log.info(
+                "Updaters: %d calls executed, %d skipped with unchanged inputs",
+                UPDATER_STATS["executed"], UPDATER_STATS["skipped"]
+            )
+        if PARTIAL_MOVIE_CACHE is not None and PARTIAL_MOVIE_CACHE.hits > 0:
+            log.info(
+                "Reused %d of %d cacheable partial movie files",
+                PARTIAL_MOVIE_CACHE.hits, PARTIAL_MOVIE_CACHE.hits + PARTIAL_MOVIE_CACHE.misses
+            )
+        super().tear_down()
+        # After the encoder is flushed in file_writer.finish()
+        if self.is_profiling():
+            self.stop_profiling()
+        # Tells custom.render_sections where the section's clip went, and
+        # which section the render started from
+        report_path = os.environ.get("MANIM_SECTION_REPORT")
+        if report_path and self.section_index is not None:
+            with open(report_path, "w", encoding="utf-8") as file:
+                file.write(f"{self.file_writer.get_movie_file_path()}\n{self.first_section}\n")
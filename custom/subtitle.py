@@ -1,10 +1,68 @@
 from manimlib import *
+from manimlib.config import get_custom_config
+
+from custom.lazy_tex import LazyTex
+
+
+def use_glyph_atlas() -> bool:
+    return bool((get_custom_config().get("subtitle") or {}).get("glyph_atlas", False))
+
+
+# custom.glyph_atlas is only imported once the atlas is enabled
+def get_glyph_atlas(font: str):
+    from custom.glyph_atlas import get_glyph_atlas
+    return get_glyph_atlas(font)
+
+
+def is_plain_text(text: str) -> bool:
+    from custom.glyph_atlas import is_plain_text
+    return is_plain_text(text)
 
 
 class Subtitle(TexText):
-    def __init__(self, *tex_strings: str, **kwargs):
+    # With lazy=True, the subtitle compiles on a worker thread and a
+    # placeholder is returned, see custom/lazy_tex.py
+    def __new__(cls, *tex_strings: str, lazy: bool = False, **kwargs):
+        if lazy:
+            return LazyTex(cls, *tex_strings, **kwargs)
+        return super().__new__(cls)
+
+    def __init__(self, *tex_strings: str, lazy: bool = False, **kwargs):
         kwargs["font"] = "monospace"
         kwargs["color"] = WHITE
 
         super().__init__(*tex_strings, **kwargs)
         self.to_edge(DOWN)
+
+    # Plain text (no math) is assembled from the glyph atlas of the font
+    # when enabled in custom_config.yml, everything else goes to LaTeX
+    def init_svg_mobject(self) -> None:
+        self.from_glyph_atlas = use_glyph_atlas() and is_plain_text(self.tex_string)
+        if not self.from_glyph_atlas:
+            super().init_svg_mobject()
+            return
+        self.add(*get_glyph_atlas(self.font).get_glyph_mobjects(self.tex_string))
+
+    def break_up_by_substrings(self):
+        if not self.from_glyph_atlas or len(self.tex_strings) == 1:
+            return super().break_up_by_substrings()
+
+        # Same structure as Tex, one SingleStringTex per substring,
+        # built from the glyphs instead of compiling each substring
+        atlas = get_glyph_atlas(self.font)
+        new_submobjects = []
+        curr_index = 0
+        for tex_string in self.tex_strings:
+            tex_string = tex_string.strip()
+            num_submobs = sum(atlas.has_ink(char) for char in tex_string)
+            if num_submobs == 0:
+                continue
+            sub_tex_mob = SingleStringTex.__new__(SingleStringTex)
+            VMobject.__init__(sub_tex_mob)
+            sub_tex_mob.tex_string = tex_string
+            new_index = curr_index + num_submobs
+            sub_tex_mob.set_submobjects(self[curr_index:new_index])
+            new_submobjects.append(sub_tex_mob)
+            curr_index = new_index
+        self.set_submobjects(new_submobjects)
+        return self
@@ -0,0 +1,259 @@
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+from manimlib import *
+from manimlib.config import get_custom_config
+from manimlib.logger import log
+from manimlib.mobject.svg.svg_mobject import SVG_HASH_TO_MOB_MAP
+from manimlib.utils.directories import get_temp_dir
+from manimlib.utils.iterables import hash_obj
+from manimlib.utils.tex_file_writing import get_tex_config
+
+from custom.disk_cache import DiskCache
+
+
+# Disk cache of parsed tex paths, addressed by the hash of everything
+# that goes into a compile. Entries are evicted least recently used
+# first once the directory grows past max_size (bytes), see DiskCache.
+#
+# Each entry is a directory of flat arrays, one .npy per data key (points,
+# fill_rgba, ...) with the submobjects concatenated, plus their offsets.
+# They are loaded memory-mapped copy-on-write. Only the template kept in
+# SVG_HASH_TO_MOB_MAP reads the mapped pages (shared by renders running
+# in parallel); every Tex instance gets its own full copy of the arrays,
+# just as manimlib copies its parsed templates.
+class TexCache(DiskCache):
+    def __init__(self, directory: str, max_size: int):
+        super().__init__(directory, max_size)
+        self.hits = 0
+        self.misses = 0
+        self.remove_legacy_entries()
+
+    # Entries of the pickle format used before, which nothing reads now
+    def remove_legacy_entries(self) -> None:
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".pkl"):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> list[tuple[dict, dict]] | None:
+        path = self.get_path(key)
+        try:
+            with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            offsets = np.load(os.path.join(path, "offsets.npy"))
+            arrays = {
+                name: np.load(os.path.join(path, name + ".npy"), mmap_mode="c")
+                for name in meta["keys"]
+            }
+        except (OSError, ValueError, KeyError):
+            # Partial or corrupt entries are removed, to be written again
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            with self.lock:
+                self.misses += 1
+            return None
+
+        self.touch(path)
+        # The counters are shared with LazyTex's threads
+        with self.lock:
+            self.hits += 1
+        return [
+            (
+                {
+                    name: arrays[name][offsets[j, i]:offsets[j, i + 1]]
+                    for j, name in enumerate(meta["keys"])
+                },
+                {
+                    name: np.array(value) if isinstance(value, list) else value
+                    for name, value in uniforms.items()
+                },
+            )
+            for i, uniforms in enumerate(meta["uniforms"])
+        ]
+
+    def put(self, key: str, data: list[tuple[dict, dict]]) -> None:
+        if len(data) == 0:
+            return
+        path = self.get_path(key)
+        names = list(data[0][0].keys())
+        offsets = np.zeros((len(names), len(data) + 1), dtype=int)
+        for j, name in enumerate(names):
+            offsets[j, 1:] = np.cumsum([len(mob_data[name]) for mob_data, _ in data])
+        meta = {
+            "keys": names,
+            "uniforms": [
+                {
+                    name: value.tolist() if hasattr(value, "tolist") else value
+                    for name, value in uniforms.items()
+                }
+                for _, uniforms in data
+            ],
+        }
+
+        # An entry replaced in place no longer counts towards the size
+        old_size = self.get_entry_size(path) if os.path.isdir(path) else 0
+
+        # Write then rename, so parallel renders never read half an entry
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(temp_path, exist_ok=True)
+        for name in names:
+            np.save(
+                os.path.join(temp_path, name + ".npy"),
+                np.concatenate([mob_data[name] for mob_data, _ in data]),
+            )
+        np.save(os.path.join(temp_path, "offsets.npy"), offsets)
+        with open(os.path.join(temp_path, "meta.json"), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        try:
+            os.rename(temp_path, path)
+        except OSError:
+            if self.is_valid_entry(path):
+                # Another render stored the same entry first
+                shutil.rmtree(temp_path, ignore_errors=True)
+                return
+            # A broken entry is in the way, replace it
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.rename(temp_path, path)
+            except OSError:
+                shutil.rmtree(temp_path, ignore_errors=True)
+                return
+
+        self.add_entry(path, old_size)
+
+    def is_valid_entry(self, path: str) -> bool:
+        try:
+            with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            names = [*meta["keys"], "offsets"]
+        except (OSError, ValueError, KeyError):
+            return False
+        return all(os.path.exists(os.path.join(path, name + ".npy")) for name in names)
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def get_tex_cache_config() -> dict:
+    return {
+        "enabled": True,
+        "max_size_mb": 256,
+        **(get_custom_config().get("tex_cache") or {}),
+    }
+
+
+# Everything that changes the compiled paths: the full tex file (which
+# already holds the template body), the template hash, the font and the
+# svg parsing options. tex_to_color_map and isolate only decide which
+# substrings get compiled, and each of those has its own entry.
+def get_tex_cache_key(tex_mob: SingleStringTex) -> str:
+    template_hash = hashlib.sha256(get_tex_config()["tex_body"].encode()).hexdigest()
+    seed = (
+        tex_mob.get_tex_file_body(tex_mob.tex_string),
+        template_hash,
+        getattr(tex_mob, "font", None),
+        tex_mob.svg_default,
+        tex_mob.path_string_config,
+    )
+    return hashlib.sha256(repr(seed).encode()).hexdigest()[:32]
+
+
+def get_mobject_data(mobject: Mobject) -> list[tuple[dict, dict]]:
+    return [(submob.data, submob.uniforms) for submob in mobject.submobjects]
+
+
+# The arrays are used as they are, so these mobjects are backed by the
+# cache's pages until something writes to them
+def get_mobjects_from_data(data: list[tuple[dict, dict]]) -> list[VMobject]:
+    mobjects = []
+    for mob_data, uniforms in data:
+        mob = VMobject()
+        mob.data.update(mob_data)
+        mob.set_uniforms(uniforms)
+        mobjects.append(mob)
+    return mobjects
+
+
+_init_svg_mobject = SingleStringTex.init_svg_mobject
+
+# One lock per svg hash, so LazyTex's worker threads building the same
+# string (or the same part of two strings) don't write and parse the
+# same tex and svg files at once, fill SVG_HASH_TO_MOB_MAP twice or
+# store the same cache entry twice
+SVG_LOCKS = {}
+SVG_LOCKS_LOCK = threading.Lock()
+
+
+def get_svg_lock(svg_hash) -> threading.Lock:
+    with SVG_LOCKS_LOCK:
+        return SVG_LOCKS.setdefault(svg_hash, threading.Lock())
+
+
+def init_svg_mobject_with_cache(self) -> None:
+    # Already parsed during this run
+    if hash_obj(self.hash_seed) in SVG_HASH_TO_MOB_MAP:
+        _init_svg_mobject(self)
+        return
+
+    key = get_tex_cache_key(self)
+    data = TEX_CACHE.get(key)
+    if data is None:
+        _init_svg_mobject(self)
+        TEX_CACHE.put(key, get_mobject_data(self))
+        return
+
+    # The template kept for this run maps the cache, instances are copies
+    template = VGroup(*get_mobjects_from_data(data))
+    SVG_HASH_TO_MOB_MAP[hash_obj(self.hash_seed)] = template
+    self.add(*template.copy())
+
+
+# The only replacement of SingleStringTex.init_svg_mobject, so the lock
+# and the cache are always chained in this order, whatever is imported
+# first. Subtitle overrides it and calls it for what it doesn't build
+# from the glyph atlas.
+def init_svg_mobject(self) -> None:
+    with get_svg_lock(hash_obj(self.hash_seed)):
+        if TEX_CACHE is None:
+            _init_svg_mobject(self)
+        else:
+            init_svg_mobject_with_cache(self)
+
+
+def log_tex_cache_stats() -> None:
+    stats = TEX_CACHE.get_stats()
+    if stats["hits"] or stats["misses"]:
+        log.info(
+            "Tex cache: %d hits, %d misses, %d evictions",
+            stats["hits"], stats["misses"], stats["evictions"]
+        )
+
+
+_tex_cache_config = get_tex_cache_config()
+
+# Left as None when disabled, so nothing under temporary_storage is touched
+TEX_CACHE = None
+
+if _tex_cache_config["enabled"]:
+    TEX_CACHE = TexCache(
+        os.path.join(get_temp_dir(), "tex_cache"),
+        max_size=int(_tex_cache_config["max_size_mb"] * 1024 * 1024),
+    )
+    atexit.register(log_tex_cache_stats)
+
+SingleStringTex.init_svg_mobject = init_svg_mobject
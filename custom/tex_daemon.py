@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import manimlib.utils.tex_file_writing
+from manimlib.logger import log
+from manimlib.utils.directories import get_temp_dir
+from manimlib.utils.tex_file_writing import dvi_to_svg
+
+from custom.tex_file_writing import run_tex
+
+
+# Compile server shared by every manimgl render on the machine. Renders
+# send the path of a tex file over a Unix socket and get back the svg;
+# the compiles run on a pool of worker processes, so parallel renders
+# share one bounded set of compiles instead of each starting its own.
+# Every job is still a separate xelatex run, so a single render gains
+# nothing but the socket round trip; nothing is kept warm between jobs.
+#
+# Unix sockets only: elsewhere, renders always compile locally.
+#
+#     python -m custom.tex_daemon -j 8      # start the server
+#     python -m custom.tex_daemon --stats   # queue depth and latencies
+
+
+def get_socket_path() -> str:
+    return os.path.join(get_temp_dir(), "tex_daemon.sock")
+
+
+# Runs in a worker process
+def compile_tex_file(tex_file: str) -> tuple[str | None, float]:
+    start = time.perf_counter()
+    dvi_file = run_tex(tex_file)
+    svg_file = dvi_to_svg(dvi_file) if dvi_file else None
+    if svg_file is not None and not os.path.exists(svg_file):
+        svg_file = None
+    return svg_file, time.perf_counter() - start
+
+
+class TexDaemonMetrics:
+    def __init__(self, num_workers: int):
+        self.num_workers = num_workers
+        self.lock = threading.Lock()
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.num_jobs = 0
+        self.num_errors = 0
+        self.latencies = []
+        self.compile_times = []
+
+    def job_started(self) -> None:
+        with self.lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    def job_finished(self, latency: float, compile_time: float, ok: bool) -> None:
+        with self.lock:
+            self.queue_depth -= 1
+            self.num_jobs += 1
+            self.num_errors += not ok
+            self.latencies.append(latency)
+            self.compile_times.append(compile_time)
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            latencies = np.array(self.latencies or [0])
+            compile_times = np.array(self.compile_times or [0])
+            return {
+                "workers": self.num_workers,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "jobs": self.num_jobs,
+                "errors": self.num_errors,
+                "latency_mean": float(latencies.mean()),
+                "latency_p50": float(np.percentile(latencies, 50)),
+                "latency_p95": float(np.percentile(latencies, 95)),
+                # Latency minus compile time is time spent waiting for a worker
+                "compile_mean": float(compile_times.mean()),
+            }
+
+
+class TexDaemonHandler(socketserver.StreamRequestHandler):
+    # Always replies, so clients never wait on a closed connection
+    def handle(self) -> None:
+        try:
+            response = self.get_response(json.loads(self.rfile.readline()))
+        except Exception as error:
+            log.warning("Tex daemon request failed: %s", error)
+            response = {"error": str(error)}
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+    def get_response(self, request: dict) -> dict:
+        server = self.server
+        if request.get("command") == "stats":
+            response = server.metrics.get_stats()
+        else:
+            start = time.perf_counter()
+            server.metrics.job_started()
+            svg_file, compile_time = None, 0.0
+            try:
+                svg_file, compile_time = server.executor.submit(
+                    compile_tex_file, request["tex_file"]
+                ).result()
+            finally:
+                latency = time.perf_counter() - start
+                server.metrics.job_finished(latency, compile_time, svg_file is not None)
+            log.debug("Compiled %s in %.3fs (%.3fs compiling)", request["tex_file"], latency, compile_time)
+            response = {"svg_file": svg_file}
+        return response
+
+
+HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+if HAS_UNIX_SOCKETS:
+    class TexDaemon(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, socket_path: str, num_workers: int):
+            self.socket_path = socket_path
+            self.executor = ProcessPoolExecutor(max_workers=num_workers)
+            self.metrics = TexDaemonMetrics(num_workers)
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            super().__init__(socket_path, TexDaemonHandler)
+
+        def server_close(self) -> None:
+            super().server_close()
+            self.executor.shutdown()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+# Seconds to wait for a reply before compiling locally instead
+REQUEST_TIMEOUT = 120
+
+
+def send_request(request: dict, socket_path: str | None = None, timeout: float = REQUEST_TIMEOUT) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or get_socket_path())
+        sock.sendall((json.dumps(request) + "\n").encode())
+        with sock.makefile("rb") as file:
+            return json.loads(file.readline())
+
+
+_tex_to_svg = manimlib.utils.tex_file_writing.tex_to_svg
+
+
+# Replaces manimlib's tex_to_svg(), handing the compile to the daemon
+# when one is running and compiling locally otherwise
+def tex_to_svg(tex_file_content: str, svg_file: str) -> str:
+    if not HAS_UNIX_SOCKETS or not os.path.exists(get_socket_path()):
+        return _tex_to_svg(tex_file_content, svg_file)
+
+    tex_file = os.path.splitext(svg_file)[0] + ".tex"
+    with open(tex_file, "w", encoding="utf-8") as outfile:
+        outfile.write(tex_file_content)
+    try:
+        response = send_request({"tex_file": os.path.abspath(tex_file)})
+    except (OSError, ValueError) as error:
+        # Not running, timed out (socket.timeout is an OSError) or a bad reply
+        log.warning("Tex daemon unavailable, compiling locally: %s", error)
+        response = {}
+    result = response.get("svg_file")
+    if result is None:
+        # Compile errors are reported locally, with the usual LaTeX log
+        return _tex_to_svg(tex_file_content, svg_file)
+
+    # Cleanup superfluous documents, as tex_to_svg() does
+    tex_dir, name = os.path.split(result)
+    stem = os.path.splitext(name)[0]
+    for file in os.listdir(tex_dir):
+        if file.startswith(stem + ".") and not file.endswith(".svg"):
+            os.remove(os.path.join(tex_dir, file))
+    return result
+
+
+manimlib.utils.tex_file_writing.tex_to_svg = tex_to_svg
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local LaTeX compile server for manimgl renders")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--socket", default=get_socket_path())
+    parser.add_argument("--stats", action="store_true", help="Print the metrics of the running server")
+    args = parser.parse_args()
+    if not HAS_UNIX_SOCKETS:
+        parser.error("the tex daemon needs Unix sockets, which this platform doesn't have")
+
+    if args.stats:
+        print(json.dumps(send_request({"command": "stats"}, args.socket), indent=4))
+        return
+
+    with TexDaemon(args.socket, args.workers) as server:
+        log.info("Serving tex compiles on %s with %d workers", args.socket, args.workers)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    log.info("Served %s", json.dumps(server.metrics.get_stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+import os
+import re
+import subprocess
+from typing import Iterable
+
+from manimlib import *
+from manimlib.logger import log
+from manimlib.utils.config_ops import digest_config
+from manimlib.utils.directories import get_tex_dir
+from manimlib.utils.tex_file_writing import display_during_execution
+from manimlib.utils.tex_file_writing import get_tex_config
+from manimlib.utils.tex_file_writing import tex_hash
+
+
+# Environment which standalone (multi mode) turns into one page per string
+BATCH_PAGE_ENV = "manimbatchpage"
+
+# Times a failed batch is halved to isolate a bad string, so one failure
+# costs at most 2 ** (MAX_BATCH_SPLITS + 1) - 1 runs; what is still not
+# compiled then is compiled one string at a time on demand
+MAX_BATCH_SPLITS = 2
+
+
+# Where manimlib's tex_to_svg_file() looks for the svg of a tex file
+def get_svg_path(tex_file_body: str) -> str:
+    return os.path.join(get_tex_dir(), tex_hash(tex_file_body) + ".svg")
+
+
+# Full tex file bodies that constructing tex_class(*tex_strings, **kwargs)
+# compiles: the joined string, plus one per substring when the string
+# is broken up by isolate / tex_to_color_map
+def get_tex_file_bodies(tex_class: type, *tex_strings: str, **kwargs) -> list[str]:
+    tex_mob = tex_class.__new__(tex_class)
+    digest_config(tex_mob, kwargs)
+    if not isinstance(tex_mob, Tex):
+        return [tex_mob.get_tex_file_body(tex_strings[0])]
+
+    tex_strings = tex_mob.break_up_tex_strings(tex_strings)
+    full_string = tex_mob.arg_separator.join(tex_strings)
+    bodies = [tex_mob.get_tex_file_body(full_string)]
+    if len(tex_strings) == 1:
+        return bodies
+
+    # Same config as Tex.break_up_by_substrings() hands to SingleStringTex
+    config = dict(tex_class.CONFIG)
+    config["alignment"] = ""
+    sub_tex_mob = SingleStringTex.__new__(SingleStringTex)
+    digest_config(sub_tex_mob, config)
+    for tex_string in tex_strings:
+        tex_string = tex_string.strip()
+        if len(tex_string) > 0:
+            bodies.append(sub_tex_mob.get_tex_file_body(tex_string))
+    return bodies
+
+
+def get_tex_command(tex_file: str) -> list[str]:
+    tex_config = get_tex_config()
+    return [
+        *tex_config["executable"].split(),
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-output-directory={os.path.dirname(tex_file)}",
+        tex_file,
+    ]
+
+
+# Returns the path of the intermediate (dvi/xdv) file, or None on error
+def run_tex(tex_file: str) -> str | None:
+    file_type = get_tex_config()["intermediate_filetype"]
+    result = os.path.splitext(tex_file)[0] + "." + file_type
+    exit_code = subprocess.call(
+        get_tex_command(tex_file),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if exit_code != 0 or not os.path.exists(result):
+        return None
+    return result
+
+
+# Splits the dvi/xdv into one svg per page, returned in page order
+def dvi_to_svg_pages(dvi_file: str) -> list[str]:
+    directory, name = os.path.split(dvi_file)
+    stem = os.path.splitext(name)[0]
+    subprocess.call(
+        [
+            "dvisvgm", dvi_file,
+            "--page=1-",
+            "-n",
+            "-v", "0",
+            "-o", os.path.join(directory, stem + "-%p.svg"),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    pattern = re.compile(re.escape(stem) + r"-(\d+)\.svg$")
+    pages = []
+    for file in os.listdir(directory):
+        match = pattern.match(file)
+        if match:
+            pages.append((int(match.group(1)), os.path.join(directory, file)))
+    return [path for _, path in sorted(pages)]
+
+
+def get_batch_file_content(expressions: list[str]) -> str | None:
+    tex_config = get_tex_config()
+    template = tex_config["tex_body"]
+    preamble, _, ending = template.partition(tex_config["text_to_replace"])
+    if r"{standalone}" not in preamble:
+        return None
+
+    # Each expression becomes its own page, with the same preamble
+    # and cropping the single-string compile would have used
+    preamble = re.sub(
+        r"\\documentclass\[([^\]]*)\]\{standalone\}",
+        lambda m: r"\documentclass[%s,multi=%s]{standalone}" % (m.group(1), BATCH_PAGE_ENV),
+        preamble,
+        count=1,
+    )
+    pages = "\n".join(
+        r"\begin{%s}" % BATCH_PAGE_ENV + "\n" + expression + "\n" + r"\end{%s}" % BATCH_PAGE_ENV
+        for expression in expressions
+    )
+    return r"\newenvironment{%s}{}{}" % BATCH_PAGE_ENV + "\n" + preamble + pages + ending
+
+
+# Compiles every tex file body whose svg is missing with a single run
+# of the tex executable, writing each page where tex_to_svg_file()
+# expects it. Bodies which could not be batched are compiled on demand
+# later as usual. Returns the svg paths written.
+def compile_tex_batch(tex_file_bodies: Iterable[str], splits: int = 0) -> list[str]:
+    tex_config = get_tex_config()
+    prefix, _, suffix = tex_config["tex_body"].partition(tex_config["text_to_replace"])
+
+    targets = {}
+    for body in tex_file_bodies:
+        svg_path = get_svg_path(body)
+        if os.path.exists(svg_path) or svg_path in targets:
+            continue
+        if not (body.startswith(prefix) and body.endswith(suffix)):
+            continue
+        targets[svg_path] = body[len(prefix):len(body) - len(suffix)]
+
+    if len(targets) == 0:
+        return []
+
+    content = get_batch_file_content(list(targets.values()))
+    if content is None:
+        return []
+
+    tex_dir = get_tex_dir()
+    stem = "batch_" + tex_hash(content)
+    tex_file = os.path.join(tex_dir, stem + ".tex")
+    with open(tex_file, "w", encoding="utf-8") as file:
+        file.write(content)
+
+    written = []
+    dvi_file = run_tex(tex_file)
+    pages = dvi_to_svg_pages(dvi_file) if dvi_file else []
+    if len(pages) == len(targets):
+        for page, svg_path in zip(pages, targets):
+            os.replace(page, svg_path)
+            written.append(svg_path)
+
+    # Cleanup, as tex_to_svg() does for single compiles
+    for file in os.listdir(tex_dir):
+        if file.startswith(stem):
+            os.remove(os.path.join(tex_dir, file))
+
+    # One bad string halts the whole run, so bisect to isolate it
+    if len(written) == 0 and len(targets) > 1 and splits < MAX_BATCH_SPLITS:
+        log.debug("Batch compile of %d strings failed, splitting it", len(targets))
+        bodies = [prefix + expression + suffix for expression in targets.values()]
+        half = len(bodies) // 2
+        written = (
+            compile_tex_batch(bodies[:half], splits + 1)
+            + compile_tex_batch(bodies[half:], splits + 1)
+        )
+    return written
+
+
+# Batch compiles everything the given constructions would compile, e.g.
+#     batch_compile_tex(Subtitle, ["这是两个三角形", "其中，"])
+#     batch_compile_tex(Tex, [("AB", "=", "DE")], tex_to_color_map=t2c_map)
+def batch_compile_tex(tex_class: type, tex_strings: Iterable[str | tuple[str, ...]], **kwargs) -> list[str]:
+    bodies = []
+    for item in tex_strings:
+        if isinstance(item, str):
+            item = (item,)
+        bodies.extend(get_tex_file_bodies(tex_class, *item, **kwargs))
+    with display_during_execution(f"Batch compiling {len(bodies)} tex strings"):
+        return compile_tex_batch(bodies)
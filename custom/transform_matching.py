@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+from manimlib import *
+
+
+# Indices of the parts with each key, in the order the keys first appear.
+# Memoized per sequence of tex part keys, so a chain of lines sharing
+# most tokens (and re-renders of it) groups each line's parts only once.
+@lru_cache(maxsize=None)
+def get_key_groups(keys: tuple[str, ...]) -> tuple[tuple[str, tuple[int, ...]], ...]:
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(key, []).append(i)
+    return tuple((key, tuple(indices)) for key, indices in groups.items())
+
+
+# TransformMatchingTex with the key to parts mapping taken from
+# get_key_groups(). The matching and the animations it builds are
+# TransformMatchingParts' own; the point data of the parts is already
+# shared through the tex cache.
+class TransformMatchingTexX(TransformMatchingTex):
+    def get_shape_map(self, mobject: VMobject) -> dict[str, VGroup]:
+        parts = self.get_mobject_parts(mobject)
+        keys = tuple(self.get_mobject_key(part) for part in parts)
+        return {
+            key: VGroup(*(parts[i] for i in indices))
+            for key, indices in get_key_groups(keys)
+        }
@@ -0,0 +1,260 @@
+import types
+from typing import Callable
+
+from manimlib import *
+
+
+# f_always, always and always_redraw which skip their work on frames
+# where nothing they read has changed, e.g. during a wait after a
+# ValueTracker animation.
+#
+# What an updater reads is inferred from its functions: closure cells,
+# default arguments, module globals named in the code and bound methods'
+# objects, following into nested Python functions. Each of those is
+# fingerprinted every frame: trackers by their value, other mobjects by
+# a version counter, and plain values by themselves. The counter goes up
+# whenever manimlib changes the data of a mobject or of anything in its
+# family: point setters all go through refresh_bounding_box, which also
+# reaches the parents, and shift/scale (apply_points_function, which only
+# refreshes the parents), interpolate (used by Transform, which writes the
+# data directly) and the color, style and uniform setters are wrapped
+# below. The updated mobject itself is fingerprinted too, so the
+# updater runs again when something else changes it. If anything read
+# is none of these (a Scene, a dict...), the updater always runs.
+# Dependencies can also be given with depends_on=[mobject or function, ...].
+#
+# Writing into mob.data directly isn't seen, unless it is followed by
+# refresh_bounding_box(), as manimlib's own setters do.
+#
+# UPDATER_STATS counts executed and skipped calls. Wrappers which can
+# skip have skips_unchanged set, which SceneX uses to hold still frames
+# during waits. Each wrapper's source_function points at the function
+# it was made for, which the profiler reports as its location.
+UPDATER_STATS = {"executed": 0, "skipped": 0}
+
+# Modules whose functions are taken as pure, and not looked into
+PURE_MODULES = ("manimlib", "numpy", "math", "builtins")
+
+PLAIN_TYPES = (int, float, complex, str, bool, type(None), np.number)
+CONSTANT_TYPES = (
+    types.ModuleType, type, types.BuiltinFunctionType,
+    types.MethodWrapperType, types.WrapperDescriptorType,
+)
+
+
+class UnknownDependency(Exception):
+    pass
+
+
+Mobject.data_version = 0
+
+
+def mark_data_changed(mobject: Mobject) -> None:
+    for mob in mobject.get_family():
+        mob.data_version += 1
+    parents = list(mobject.parents)
+    while parents:
+        parent = parents.pop()
+        parent.data_version += 1
+        parents.extend(parent.parents)
+
+
+def counting_data_changes(method: Callable) -> Callable:
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        mark_data_changed(self)
+        return result
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    return wrapper
+
+
+_refresh_bounding_box = Mobject.refresh_bounding_box
+
+
+def refresh_bounding_box(self, recurse_down: bool = False, recurse_up: bool = True):
+    for mob in self.get_family(recurse_down):
+        mob.data_version += 1
+    return _refresh_bounding_box(self, recurse_down, recurse_up)
+
+
+Mobject.refresh_bounding_box = refresh_bounding_box
+for cls, name in [
+    (Mobject, "set_data"),
+    (Mobject, "apply_points_function"),
+    (Mobject, "interpolate"),
+    (Mobject, "set_uniforms"),
+    (Mobject, "reverse_points"),
+    (Mobject, "set_rgba_array"),
+    (Mobject, "set_rgba_array_by_color"),
+    (Mobject, "set_reflectiveness"),
+    (Mobject, "set_shadow"),
+    (Mobject, "set_gloss"),
+    (VMobject, "set_fill"),
+    (VMobject, "set_stroke"),
+    (VMobject, "set_backstroke"),
+    (VMobject, "set_style"),
+]:
+    setattr(cls, name, counting_data_changes(getattr(cls, name)))
+
+
+def get_mobject_fingerprint(mobject: Mobject) -> tuple:
+    return (id(mobject), mobject.data_version)
+
+
+def get_fingerprint(value, strict: bool = False):
+    if isinstance(value, ValueTracker):
+        return (id(value), np.array(value.get_value()).tobytes())
+    if isinstance(value, DecimalNumber):
+        return (value.get_value(), *get_mobject_fingerprint(value))
+    if isinstance(value, Mobject):
+        return get_mobject_fingerprint(value)
+    if isinstance(value, PLAIN_TYPES):
+        return value
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+    if isinstance(value, (tuple, list)):
+        return tuple(get_fingerprint(v, strict) for v in value)
+    if isinstance(value, (*CONSTANT_TYPES, types.FunctionType, types.MethodType)):
+        return id(value)
+    if strict:
+        raise UnknownDependency(type(value).__name__)
+    # Never equal to a previous one
+    return object()
+
+
+def is_pure_function(function) -> bool:
+    module = getattr(function, "__module__", None) or ""
+    return module.split(".")[0] in PURE_MODULES
+
+
+def get_code_names(code: types.CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= get_code_names(const)
+    return names
+
+
+# Functions returning the current value of everything the object reads
+def get_sources(obj, seen: set | None = None) -> list[Callable]:
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return []
+    seen.add(id(obj))
+
+    if isinstance(obj, types.MethodType):
+        get_fingerprint(obj.__self__, strict=True)
+        return [lambda: obj.__self__] + get_sources(obj.__func__, seen)
+    if not isinstance(obj, types.FunctionType):
+        get_fingerprint(obj, strict=True)
+        return [lambda: obj]
+    if is_pure_function(obj):
+        return []
+
+    sources = []
+    values = []
+    for cell in obj.__closure__ or ():
+        sources.append(lambda cell=cell: cell.cell_contents)
+        values.append(cell.cell_contents)
+    for name in sorted(get_code_names(obj.__code__)):
+        if name in obj.__globals__:
+            sources.append(lambda name=name: obj.__globals__.get(name))
+            values.append(obj.__globals__[name])
+    for default in obj.__defaults__ or ():
+        sources.append(lambda default=default: default)
+        values.append(default)
+
+    for value in values:
+        if isinstance(value, (types.FunctionType, types.MethodType)):
+            sources.extend(get_sources(value, seen))
+        else:
+            # Raises for what can't be fingerprinted
+            get_fingerprint(value, strict=True)
+    return sources
+
+
+# Sources of the functions an updater calls and the values it passes,
+# or None when they can't all be followed
+def get_dependency_sources(functions, values=(), depends_on=None) -> list[Callable] | None:
+    if depends_on is not None:
+        return [
+            dep if callable(dep) and not isinstance(dep, Mobject) else (lambda dep=dep: dep)
+            for dep in depends_on
+        ]
+    try:
+        seen = set()
+        sources = [source for function in functions for source in get_sources(function, seen)]
+        for value in values:
+            get_fingerprint(value, strict=True)
+            sources.append(lambda value=value: value)
+        return sources
+    except (UnknownDependency, ValueError):
+        return None
+
+
+# Wraps an updater so it only runs when a source or the mobject changed
+def get_skipping_updater(updater: Callable, sources: list[Callable] | None) -> Callable:
+    if sources is None:
+        def counted_updater(m):
+            UPDATER_STATS["executed"] += 1
+            updater(m)
+        counted_updater.source_function = updater
+        return counted_updater
+
+    last_state = [None]
+
+    # Copies of the mobject share the updater, so the one passed in counts
+    def get_state(m):
+        return (get_fingerprint(m), *(get_fingerprint(source()) for source in sources))
+
+    def skipping_updater(m):
+        if get_state(m) == last_state[0]:
+            UPDATER_STATS["skipped"] += 1
+            return
+        UPDATER_STATS["executed"] += 1
+        updater(m)
+        last_state[0] = get_state(m)
+
+    skipping_updater.source_function = updater
+    skipping_updater.skips_unchanged = True
+    return skipping_updater
+
+
+def f_always(method, *arg_generators, depends_on=None, **kwargs):
+    mobject = method.__self__
+    func = method.__func__
+
+    def updater(mob):
+        args = [arg_generator() for arg_generator in arg_generators]
+        func(mob, *args, **kwargs)
+    updater.source_function = arg_generators[0] if arg_generators else func
+
+    sources = get_dependency_sources(arg_generators, kwargs.values(), depends_on)
+    mobject.add_updater(get_skipping_updater(updater, sources))
+    return mobject
+
+
+def always(method, *args, depends_on=None, **kwargs):
+    mobject = method.__self__
+    func = method.__func__
+
+    def updater(mob):
+        func(mob, *args, **kwargs)
+    updater.source_function = func
+
+    sources = get_dependency_sources([], [*args, *kwargs.values()], depends_on)
+    mobject.add_updater(get_skipping_updater(updater, sources))
+    return mobject
+
+
+def always_redraw(func: Callable[..., Mobject], *args, depends_on=None, **kwargs) -> Mobject:
+    mob = func(*args, **kwargs)
+
+    def updater(m):
+        m.become(func(*args, **kwargs))
+    updater.source_function = func
+
+    sources = get_dependency_sources([func], [*args, *kwargs.values()], depends_on)
+    mob.add_updater(get_skipping_updater(updater, sources))
+    return mob
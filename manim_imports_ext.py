@@ -1,4 +1,14 @@
 from manimlib import *
 
+from custom.tex_cache import *
+from custom.tex_file_writing import *
+from custom.tex_daemon import *
+from custom.color_map import *
+from custom.transform_matching import *
+from custom.graph import *
+from custom.parameter_sweep import *
+from custom.lazy_tex import *
 from custom.subtitle import *
 from custom.geometry import *
+from custom.updaters import *
+from custom.scene import *
@@ -0,0 +1,75 @@
+import pickle
+
+import pytest
+
+pytest.importorskip("manimlib")
+
+from custom.checkpoint import dump_scene_state
+from custom.checkpoint import load_scene_state
+
+
+OFFSET = 1
+
+
+class FakeScene:
+    def __init__(self):
+        self.camera = object()
+
+    def construct(self):
+        pass
+
+
+def make_updater(k):
+    def updater(x):
+        return k * x + OFFSET
+    updater.skips_unchanged = True
+    return updater
+
+
+def test_lambdas_and_closures_round_trip():
+    scene = FakeScene()
+    state = {
+        "lambda": lambda x: x ** 2,
+        "closure": make_updater(3),
+        "recursive": None,
+    }
+
+    def factorial(n):
+        return 1 if n == 0 else n * factorial(n - 1)
+    state["recursive"] = factorial
+
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(state)
+    loaded = load_scene_state(FakeScene(), dump_scene_state(scene, state))
+    assert loaded["lambda"](3) == 9
+    assert loaded["closure"](2) == 7
+    assert loaded["closure"].skips_unchanged
+    assert loaded["recursive"](5) == 120
+
+
+def test_scene_and_camera_refer_to_the_loading_scene():
+    scene = FakeScene()
+    state = {"get_scene": lambda: scene, "scene": scene, "camera": scene.camera}
+    new_scene = FakeScene()
+    loaded = load_scene_state(new_scene, dump_scene_state(scene, state))
+    assert loaded["scene"] is new_scene
+    assert loaded["camera"] is new_scene.camera
+    # The closure cell holds the scene, which is replaced too
+    assert loaded["get_scene"]() is new_scene
+
+
+def test_functions_read_the_current_module_globals():
+    global OFFSET
+    scene = FakeScene()
+    data = dump_scene_state(scene, {"closure": make_updater(1)})
+    OFFSET = 10
+    try:
+        assert load_scene_state(scene, data)["closure"](1) == 11
+    finally:
+        OFFSET = 1
+
+
+def test_unpicklable_state_still_fails():
+    scene = FakeScene()
+    with pytest.raises(TypeError):
+        dump_scene_state(scene, {"generator": (i for i in range(3))})
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib import BLUE
+from manimlib import RED
+
+from custom.color_map import ColorMap
+
+
+def test_split_isolates_every_key():
+    color_map = ColorMap({"AB": BLUE, "DE": RED})
+    assert color_map.split(("AB = DE",)) == ["AB", " = ", "DE"]
+    assert color_map.split(("AB", "+ C")) == ["AB", "+ C"]
+
+
+def test_split_isolates_extra_substrings():
+    color_map = ColorMap({"AB": BLUE})
+    assert color_map.split(("AB = C",), isolate=("C",)) == ["AB", " = ", "C"]
+
+
+def test_split_is_cached_but_returns_copies():
+    color_map = ColorMap({"AB": BLUE})
+    parts = color_map.split(("AB = DE",))
+    parts.append("changed")
+    assert color_map.split(("AB = DE",)) == ["AB", " = DE"]
+
+
+def test_split_without_keys_keeps_the_strings():
+    assert ColorMap({}).split(("AB", "", "C")) == ["AB", "C"]
+
+
+def test_last_contained_key_gives_the_color():
+    color_map = ColorMap({"A": BLUE, "AB": RED})
+    assert color_map.get_color("AB") == RED
+    assert color_map.get_color("A") == BLUE
+    assert color_map.get_color("C") is None
@@ -0,0 +1,45 @@
+import os
+
+from custom.disk_cache import DiskCache
+
+
+def write_entry(cache: DiskCache, name: str, size: int, mtime: float) -> str:
+    path = os.path.join(cache.directory, name)
+    old_size = cache.get_entry_size(path) if os.path.exists(path) else 0
+    with open(path, "wb") as file:
+        file.write(b"0" * size)
+    os.utime(path, (mtime, mtime))
+    cache.add_entry(path, old_size)
+    return path
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), max_size=250)
+    write_entry(cache, "a", 100, 1)
+    write_entry(cache, "b", 100, 2)
+    os.utime(os.path.join(cache.directory, "a"), (3, 3))
+    write_entry(cache, "c", 100, 4)
+
+    assert sorted(os.listdir(cache.directory)) == ["a", "c"]
+    assert cache.size == 200
+    assert cache.evictions == 1
+
+
+def test_replaced_entries_count_once(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), max_size=250)
+    write_entry(cache, "a", 100, 1)
+    write_entry(cache, "a", 150, 2)
+    write_entry(cache, "b", 100, 3)
+
+    assert cache.size == 250
+    assert cache.evictions == 0
+
+
+def test_entries_being_written_are_left_alone(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), max_size=50)
+    with open(os.path.join(cache.directory, "a.123.tmp"), "wb") as file:
+        file.write(b"0" * 100)
+    write_entry(cache, "b", 100, 1)
+
+    assert os.listdir(cache.directory) == ["a.123.tmp"]
+    assert cache.size == 0
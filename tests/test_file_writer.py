@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from custom.file_writer import SceneFileWriterX
+
+
+def get_writer(pipe_command: list[str]) -> SceneFileWriterX:
+    writer = SceneFileWriterX.__new__(SceneFileWriterX)
+    writer.pipe_command = pipe_command
+    return writer
+
+
+def test_still_segment_adds_the_loop_after_the_pipe_filters():
+    writer = get_writer(["ffmpeg", "-i", "-", "-vf", "vflip", "-vcodec", "libx264", "out_temp.mp4"])
+    command = writer.get_segment_command("seg.mp4", "loop=loop=59:size=1")
+    assert command == [
+        "ffmpeg", "-i", "-", "-vf", "vflip,loop=loop=59:size=1", "-vcodec", "libx264", "seg.mp4"
+    ]
+    assert writer.pipe_command[-1] == "out_temp.mp4"
+
+
+def test_still_segment_without_pipe_filters():
+    writer = get_writer(["ffmpeg", "-i", "-", "out_temp.mp4"])
+    command = writer.get_segment_command("seg.mp4", "loop=loop=9:size=1")
+    assert command == ["ffmpeg", "-i", "-", "-vf", "loop=loop=9:size=1", "seg.mp4"]
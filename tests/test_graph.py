@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib import Dot
+from manimlib import RIGHT
+from manimlib import UP
+
+from custom.graph import AxesX
+from custom.graph import get_function_key
+from custom.graph import get_path_bounds
+from custom.graph import merge_discontinuities
+
+
+def test_path_bounds_split_at_discontinuities():
+    bounds = get_path_bounds((-4, 4, 0.1), [0, 10], epsilon=1e-8)
+    assert bounds == [(-4, -1e-8), (1e-8, 4)]
+
+
+def test_detected_pole_next_to_an_explicit_one_is_dropped():
+    assert merge_discontinuities([0], [3e-9, 2.0], epsilon=1e-8) == [0, 2.0]
+
+
+def test_detected_poles_are_added():
+    assert merge_discontinuities([], [1.0, -1.0]) == [-1.0, 1.0]
+
+
+def test_merged_pole_leaves_no_path_across_it():
+    discontinuities = merge_discontinuities([0], [-4e-9], epsilon=1e-8)
+    bounds = get_path_bounds((-4, 4, 0.1), discontinuities, epsilon=1e-8)
+    assert len(bounds) == 2
+    assert all(not t1 < 0 < t2 for t1, t2 in bounds)
+
+
+def test_find_poles_skips_zeros():
+    axes = AxesX(x_range=(-4, 4), y_range=(-4, 4), width=6, height=6)
+    t_range = axes.get_t_range()
+    poles = axes.find_poles(lambda x: x - 0.25 + 1 / x, t_range, 1e-8)
+    assert len(poles) == 1
+    assert abs(poles[0]) < 1e-7
+    assert axes.find_poles(lambda x: x - 0.5, t_range, 1e-8) == []
+
+
+def test_graph_with_detected_and_explicit_pole_has_two_paths():
+    axes = AxesX(
+        x_range=(-4, 4), y_range=(-4, 4), width=6, height=6,
+        detect_graph_discontinuities=True,
+    )
+    graph = axes.get_graph(lambda x: 1 / x, discontinuities=[0])
+    assert len(graph.get_subpaths()) == 2
+    assert np.isfinite(graph.get_points()).all()
+
+
+def test_i2gp_without_a_function_stays_within_one_path():
+    axes = AxesX(x_range=(-4, 4), y_range=(-4, 4), width=6, height=6)
+    graph = axes.get_graph(lambda x: x, discontinuities=[0])
+    del graph.underlying_function
+    assert axes.i2gp(1, graph) == pytest.approx(axes.c2p(1, 1))
+    assert axes.i2gp(0, graph) is None
+    assert axes.i2gp(5, graph) is None
+
+    graph.shift(UP)
+    assert axes.i2gp(1, graph) == pytest.approx(axes.c2p(1, 1) + UP)
+
+
+def test_reference_line_resets_dashes_with_other_point_counts():
+    axes = AxesX(x_range=(-4, 4), y_range=(-4, 4), width=6, height=6)
+    dot = Dot(axes.c2p(1, 2))
+    line = axes.get_v_line_to(dot)
+    line[0].set_points(np.zeros((9, 3)))
+    dot.shift(RIGHT)
+    line.update()
+    assert all(dash.get_num_points() == 3 for dash in line)
+    assert line[-1].get_end()[0] == pytest.approx(dot.get_x())
+
+
+def test_function_key_follows_code_and_captured_values():
+    def get_function(a):
+        return lambda x: a * x + 1
+
+    assert get_function_key(get_function(2)) == get_function_key(get_function(2))
+    assert get_function_key(get_function(2)) != get_function_key(get_function(3))
+    assert get_function_key(lambda x: x + 1) != get_function_key(lambda x: x + 2)
+
+
+def test_function_key_refuses_unplain_values():
+    dot = Dot()
+    assert get_function_key(lambda x: dot.get_x() * x) is None
+    assert get_function_key(np.sin) is None
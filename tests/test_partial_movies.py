@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib import *
+
+from custom.partial_movies import ContentHasher
+from custom.partial_movies import Unhashable
+
+
+def get_digest(value) -> str:
+    hasher = ContentHasher()
+    hasher.update(value)
+    return hasher.hexdigest()
+
+
+def test_equal_mobjects_hash_equal():
+    assert get_digest([Square(), 1.5]) == get_digest([Square(), 1.5])
+
+
+def test_changed_points_and_colors_change_the_hash():
+    digest = get_digest(Square())
+    assert get_digest(Square().shift(RIGHT)) != digest
+    assert get_digest(Square().set_color(RED)) != digest
+
+
+def test_change_counter_is_not_content():
+    square = Square()
+    digest = get_digest(square)
+    square.data_version += 1
+    assert get_digest(square) == digest
+
+
+def test_functions_hash_by_code_and_captured_values():
+    def get_function(a):
+        return lambda x: a * x
+
+    assert get_digest(get_function(2)) == get_digest(get_function(2))
+    assert get_digest(get_function(2)) != get_digest(get_function(3))
+
+
+def test_time_based_updaters_are_unhashable():
+    square = Square()
+    square.add_updater(lambda m, dt: m.rotate(dt))
+    with pytest.raises(Unhashable):
+        get_digest(square)
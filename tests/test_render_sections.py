@@ -0,0 +1,64 @@
+import os
+import shutil
+import textwrap
+
+import pytest
+
+pytest.importorskip("manimlib")
+if shutil.which("ffmpeg") is None:
+    pytest.skip("ffmpeg is not installed", allow_module_level=True)
+
+from custom.render_sections import count_sections
+from custom.render_sections import render_section
+from custom.render_sections import write_checkpoints
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENE_SOURCE = textwrap.dedent("""
+    from manim_imports_ext import *
+
+
+    square = Square()
+
+
+    class Sections(SceneX):
+        def construct(self):
+            self.run_sections(self.first, self.second, self.third)
+
+        def first(self):
+            self.tracker = ValueTracker(0)
+            self.dot = Dot()
+            self.dot.add_updater(lambda m: m.set_x(self.tracker.get_value()))
+            self.add(square, self.dot)
+            self.play(self.tracker.animate.set_value(1), run_time=0.5)
+
+        def second(self):
+            self.play(self.tracker.animate.set_value(2), run_time=0.5)
+
+        def third(self):
+            self.play(square.animate.shift(RIGHT), run_time=0.5)
+""")
+
+
+def test_count_sections(tmp_path):
+    scene_file = tmp_path / "sections.py"
+    scene_file.write_text(SCENE_SOURCE, encoding="utf-8")
+    assert count_sections(str(scene_file), "Sections") == 3
+
+
+# The workers start from the checkpoints written beforehand, lambda
+# updaters and module level mobjects included
+def test_workers_start_from_their_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_DIR)
+    scene_file = tmp_path / "sections.py"
+    scene_file.write_text(SCENE_SOURCE, encoding="utf-8")
+    manimgl_args = ["-l", "--video_dir", str(tmp_path / "videos")]
+
+    write_checkpoints(str(scene_file), "Sections", manimgl_args)
+    for index in range(3):
+        clip_path, first_section = render_section(
+            str(scene_file), "Sections", index, manimgl_args, str(tmp_path)
+        )
+        assert first_section == index
+        assert os.path.exists(clip_path)
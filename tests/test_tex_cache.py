@@ -0,0 +1,108 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib import SingleStringTex
+from manimlib.utils.config_ops import digest_config
+
+from custom.tex_cache import TexCache
+from custom.tex_cache import get_tex_cache_key
+
+
+def get_data(num_mobjects: int, num_points: int = 6) -> list[tuple[dict, dict]]:
+    return [
+        (
+            {
+                "points": np.full((num_points, 3), i, dtype=float),
+                "fill_rgba": np.full((1, 4), 0.5),
+            },
+            {"is_fixed_in_frame": 0.0, "gloss": float(i)},
+        )
+        for i in range(num_mobjects)
+    ]
+
+
+def test_put_then_get_returns_the_same_data(tmp_path):
+    cache = TexCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    data = get_data(3)
+    cache.put("a", data)
+    loaded = cache.get("a")
+
+    assert len(loaded) == 3
+    for (mob_data, uniforms), (loaded_data, loaded_uniforms) in zip(data, loaded):
+        assert set(loaded_data) == set(mob_data)
+        for name in mob_data:
+            assert np.array_equal(loaded_data[name], mob_data[name])
+        assert loaded_uniforms == uniforms
+    assert cache.get_stats() == {"hits": 1, "misses": 0, "evictions": 0}
+
+
+def test_missing_entry_is_a_miss(tmp_path):
+    cache = TexCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_size_counts_replaced_entries_once(tmp_path):
+    cache = TexCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    cache.put("a", get_data(2))
+    cache.put("b", get_data(2))
+    cache.put("a", get_data(4))
+    assert cache.size == cache.get_total_size()
+    assert cache.evictions == 0
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = TexCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    cache.put("a", get_data(2))
+    entry_size = cache.get_entry_size(cache.get_path("a"))
+    cache.max_size = int(2.5 * entry_size)
+    cache.put("b", get_data(2))
+    os.utime(cache.get_path("a"), (1, 1))
+    os.utime(cache.get_path("b"), (2, 2))
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+    cache.put("c", get_data(2))
+
+    assert sorted(entry.name for entry in cache.get_entries()) == ["a", "c"]
+    assert cache.evictions == 1
+    assert cache.size == cache.get_total_size()
+
+
+def test_corrupt_entry_is_removed(tmp_path):
+    cache = TexCache(str(tmp_path / "cache"), max_size=10 ** 6)
+    cache.put("a", get_data(2))
+    os.remove(os.path.join(cache.get_path("a"), "meta.json"))
+
+    assert cache.get("a") is None
+    assert not os.path.exists(cache.get_path("a"))
+    cache.put("a", get_data(2))
+    assert cache.get("a") is not None
+
+
+def test_legacy_entries_are_removed(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    (directory / "old.pkl").write_bytes(b"0")
+    TexCache(str(directory), max_size=10 ** 6)
+    assert os.listdir(directory) == []
+
+
+def get_tex(tex_string: str, **kwargs) -> SingleStringTex:
+    tex = SingleStringTex.__new__(SingleStringTex)
+    digest_config(tex, kwargs)
+    tex.tex_string = tex_string
+    return tex
+
+
+def test_cache_key_follows_string_and_font():
+    key = get_tex_cache_key(get_tex("AB"))
+    assert get_tex_cache_key(get_tex("AB")) == key
+    assert get_tex_cache_key(get_tex("AC")) != key
+
+    with_font = get_tex("AB")
+    with_font.font = "monospace"
+    assert get_tex_cache_key(with_font) != key
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from custom.transform_matching import get_key_groups
+
+
+def test_key_groups_keep_first_appearance_order():
+    keys = ("c^2", "=", "a^2", "+", "b^2", "-", "2ab", "+", "=")
+    assert get_key_groups(keys) == (
+        ("c^2", (0,)),
+        ("=", (1, 8)),
+        ("a^2", (2,)),
+        ("+", (3, 7)),
+        ("b^2", (4,)),
+        ("-", (5,)),
+        ("2ab", (6,)),
+    )
+
+
+def test_key_groups_are_memoized():
+    keys = ("x", "y", "x")
+    assert get_key_groups(keys) is get_key_groups(tuple(["x", "y", "x"]))
@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("manimlib")
+
+from manimlib import *
+
+from custom.updaters import UPDATER_STATS
+from custom.updaters import f_always
+from custom.updaters import get_mobject_fingerprint
+
+
+def test_fingerprint_follows_points_colors_and_children():
+    child = Square()
+    group = VGroup(child, Circle())
+    fingerprints = [get_mobject_fingerprint(group)]
+    for change in [
+        lambda: child.shift(RIGHT),
+        lambda: child.set_fill(RED, 0.5),
+        lambda: child.set_stroke(width=8),
+        lambda: group.add(Dot()),
+    ]:
+        change()
+        fingerprints.append(get_mobject_fingerprint(group))
+    assert len(set(fingerprints)) == len(fingerprints)
+    assert get_mobject_fingerprint(group) == fingerprints[-1]
+
+
+def test_fingerprint_follows_moves_and_transforms():
+    square = Square()
+    fingerprints = [get_mobject_fingerprint(square)]
+    for change in [
+        lambda: square.shift(RIGHT),
+        lambda: square.scale(2),
+        lambda: square.interpolate(Square(), Circle(), 0.5),
+    ]:
+        change()
+        fingerprints.append(get_mobject_fingerprint(square))
+    assert len(set(fingerprints)) == len(fingerprints)
+
+
+def test_updater_skips_while_its_inputs_are_unchanged():
+    tracker = ValueTracker(0)
+    axes = Axes()
+    dot = Dot()
+    f_always(dot.move_to, lambda: axes.c2p(tracker.get_value(), 0))
+    executed = UPDATER_STATS["executed"]
+    skipped = UPDATER_STATS["skipped"]
+
+    # add_updater has already run it once
+    dot.update()
+    dot.update()
+    assert UPDATER_STATS["executed"] == executed
+    assert UPDATER_STATS["skipped"] == skipped + 2
+
+    tracker.set_value(2)
+    dot.update()
+    assert UPDATER_STATS["executed"] == executed + 1
+    assert dot.get_center() == pytest.approx(axes.c2p(2, 0))
+
+    axes.shift(UP)
+    dot.update()
+    assert UPDATER_STATS["executed"] == executed + 2
+    assert dot.get_center() == pytest.approx(axes.c2p(2, 0))